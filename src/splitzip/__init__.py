@@ -25,7 +25,7 @@ along with all .zXX files for extraction.
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import (
     CompressionError,
@@ -38,7 +38,11 @@ from .exceptions import (
 )
 from .structures import Compression
 from .utils import format_size, parse_size
-from .writer import SplitZipWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .writer import SplitZipWriter
 
 __version__ = "0.2.0"
 __all__ = [
@@ -68,6 +72,19 @@ STORED = Compression.STORED
 DEFLATED = Compression.DEFLATED
 
 
+def __getattr__(name: str) -> Any:
+    # The writer pulls in threading, mmap, queue and concurrent.futures (and
+    # with it logging); load it on first use so that e.g.
+    # `python -m splitzip --version` stays cheap. zlib and the optional
+    # libdeflate backend are not deferred: .utils imports them for CRC-32.
+    if name == "SplitZipWriter":
+        from .writer import SplitZipWriter
+
+        globals()["SplitZipWriter"] = SplitZipWriter
+        return SplitZipWriter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def create(
     path: str,
     files: list[str],
@@ -101,6 +118,8 @@ def create(
         ... )
         [Path('backup.z01'), Path('backup.z02'), Path('backup.zip')]
     """
+    from .writer import SplitZipWriter
+
     with SplitZipWriter(
         path,
         split_size=split_size,
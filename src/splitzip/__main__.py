@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import argparse
+import os
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from . import SplitZipWriter, __version__, format_size, parse_size
+from . import __version__, format_size, parse_size
 from .structures import Compression
 
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+
 
 def progress_callback(filename: str, done: int, total: int) -> None:
     """Print progress for current file."""
@@ -17,7 +21,7 @@ def progress_callback(filename: str, done: int, total: int) -> None:
         bar_width = 30
         filled = int(bar_width * done / total)
         bar = "█" * filled + "░" * (bar_width - filled)
-        print(f"\r  {bar} {pct:5.1f}% {Path(filename).name}", end="", flush=True)
+        print(f"\r  {bar} {pct:5.1f}% {os.path.basename(filename)}", end="", flush=True)
         if done >= total:
             print()
 
@@ -29,6 +33,10 @@ def volume_callback(volume_num: int, path: Path) -> None:
 
 def cmd_create(args: argparse.Namespace) -> int:
     """Handle the create command."""
+    from pathlib import Path
+
+    from .writer import SplitZipWriter
+
     output = Path(args.output)
     files = [Path(f) for f in args.files]
 
@@ -80,6 +88,16 @@ def cmd_create(args: argparse.Namespace) -> int:
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer --version before importing argparse or building the parser
+    if argv[:1] == ["--version"]:
+        print(f"splitzip {__version__}")
+        return 0
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="splitzip",
         description="Create split ZIP archives compatible with standard tools.",
@@ -7,6 +7,7 @@ https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT
 from __future__ import annotations
 
 import struct
+import sys
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import ClassVar
@@ -33,6 +34,9 @@ class GeneralPurposeFlag(IntEnum):
     MASKED_HEADERS = 1 << 13
 
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Signatures
 LOCAL_FILE_HEADER_SIG = 0x04034B50
 CENTRAL_DIR_HEADER_SIG = 0x02014B50
@@ -40,7 +44,7 @@ END_OF_CENTRAL_DIR_SIG = 0x06054B50
 DATA_DESCRIPTOR_SIG = 0x08074B50
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LocalFileHeader:
     """Local file header structure (precedes each file's data)."""
 
@@ -61,8 +65,7 @@ class LocalFileHeader:
 
     def to_bytes(self) -> bytes:
         """Serialize to bytes."""
-        header = struct.pack(
-            self.STRUCT_FORMAT,
+        header = _LFH.pack(
             self.SIGNATURE,
             self.version_needed,
             self.flags,
@@ -75,7 +78,19 @@ class LocalFileHeader:
             len(self.filename),
             len(self.extra),
         )
-        return header + self.filename + self.extra
+        # The writer never sets extra fields; a single concat covers that case
+        if not self.extra:
+            return header + self.filename
+        return b"".join((header, self.filename, self.extra))
+
+    @classmethod
+    def dir_bytes(cls, filename: bytes, mod_time: int, mod_date: int, flags: int = 0) -> bytes:
+        """Serialize a directory entry's header (STORED, no data) without an instance."""
+        header = _LFH.pack(
+            cls.SIGNATURE, 20, flags, Compression.STORED, mod_time, mod_date,
+            0, 0, 0, len(filename), 0,
+        )
+        return header + filename
 
     @classmethod
     def from_bytes(cls, data: bytes) -> LocalFileHeader:
@@ -95,7 +110,7 @@ class LocalFileHeader:
             uncompressed_size,
             filename_len,
             extra_len,
-        ) = struct.unpack(cls.STRUCT_FORMAT, data[: cls.FIXED_SIZE])
+        ) = _LFH.unpack_from(data, 0)
 
         if sig != cls.SIGNATURE:
             raise ValueError(f"Invalid local file header signature: {sig:#010x}")
@@ -122,7 +137,10 @@ class LocalFileHeader:
         return self.FIXED_SIZE + len(self.filename) + len(self.extra)
 
 
-@dataclass
+_LFH = struct.Struct(LocalFileHeader.STRUCT_FORMAT)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DataDescriptor:
     """Optional data descriptor (follows file data when sizes unknown upfront)."""
 
@@ -139,23 +157,25 @@ class DataDescriptor:
     def to_bytes(self, include_signature: bool = True) -> bytes:
         """Serialize to bytes."""
         if include_signature:
-            return struct.pack(
-                self.STRUCT_FORMAT_WITH_SIG,
+            return _DD_SIG.pack(
                 self.SIGNATURE,
                 self.crc32,
                 self.compressed_size,
                 self.uncompressed_size,
             )
         else:
-            return struct.pack(
-                self.STRUCT_FORMAT_NO_SIG,
+            return _DD_NOSIG.pack(
                 self.crc32,
                 self.compressed_size,
                 self.uncompressed_size,
             )
 
 
-@dataclass
+_DD_SIG = struct.Struct(DataDescriptor.STRUCT_FORMAT_WITH_SIG)
+_DD_NOSIG = struct.Struct(DataDescriptor.STRUCT_FORMAT_NO_SIG)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CentralDirectoryHeader:
     """Central directory file header."""
 
@@ -182,8 +202,7 @@ class CentralDirectoryHeader:
 
     def to_bytes(self) -> bytes:
         """Serialize to bytes."""
-        header = struct.pack(
-            self.STRUCT_FORMAT,
+        header = _CDH.pack(
             self.SIGNATURE,
             self.version_made_by,
             self.version_needed,
@@ -202,7 +221,9 @@ class CentralDirectoryHeader:
             self.external_attr,
             self.local_header_offset,
         )
-        return header + self.filename + self.extra + self.comment
+        if not self.extra and not self.comment:
+            return header + self.filename
+        return b"".join((header, self.filename, self.extra, self.comment))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> CentralDirectoryHeader:
@@ -230,7 +251,7 @@ class CentralDirectoryHeader:
             internal_attr,
             external_attr,
             local_header_offset,
-        ) = struct.unpack(cls.STRUCT_FORMAT, data[: cls.FIXED_SIZE])
+        ) = _CDH.unpack_from(data, 0)
 
         if sig != cls.SIGNATURE:
             raise ValueError(f"Invalid central directory header signature: {sig:#010x}")
@@ -267,7 +288,10 @@ class CentralDirectoryHeader:
         return self.FIXED_SIZE + len(self.filename) + len(self.extra) + len(self.comment)
 
 
-@dataclass
+_CDH = struct.Struct(CentralDirectoryHeader.STRUCT_FORMAT)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EndOfCentralDirectory:
     """End of central directory record."""
 
@@ -285,8 +309,7 @@ class EndOfCentralDirectory:
 
     def to_bytes(self) -> bytes:
         """Serialize to bytes."""
-        return struct.pack(
-            self.STRUCT_FORMAT,
+        header = _EOCD.pack(
             self.SIGNATURE,
             self.disk_number,
             self.disk_with_cd_start,
@@ -295,7 +318,9 @@ class EndOfCentralDirectory:
             self.cd_size,
             self.cd_offset,
             len(self.comment),
-        ) + self.comment
+        )
+        # Archive comments are rare; skip the copy when there is none
+        return header + self.comment if self.comment else header
 
     @classmethod
     def from_bytes(cls, data: bytes) -> EndOfCentralDirectory:
@@ -314,7 +339,7 @@ class EndOfCentralDirectory:
             cd_size,
             cd_offset,
             comment_len,
-        ) = struct.unpack(cls.STRUCT_FORMAT, data[: cls.FIXED_SIZE])
+        ) = _EOCD.unpack_from(data, 0)
 
         if sig != cls.SIGNATURE:
             raise ValueError(f"Invalid end of central directory signature: {sig:#010x}")
@@ -337,7 +362,10 @@ class EndOfCentralDirectory:
         return self.FIXED_SIZE + len(self.comment)
 
 
-@dataclass
+_EOCD = struct.Struct(EndOfCentralDirectory.STRUCT_FORMAT)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ZipEntry:
     """Internal tracking of an entry being written."""
 
@@ -352,6 +380,7 @@ class ZipEntry:
     disk_number_start: int = 0
     local_header_offset: int = 0
     external_attr: int = 0
+    flags: int = GeneralPurposeFlag.UTF8
     extra: bytes = b""
     comment: bytes = b""
 
@@ -360,7 +389,7 @@ class ZipEntry:
         return CentralDirectoryHeader(
             version_made_by=20,
             version_needed=20,
-            flags=GeneralPurposeFlag.UTF8,
+            flags=self.flags,
             compression=self.compression,
             mod_time=self.mod_time,
             mod_date=self.mod_date,
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-import posixpath
 import re
 import time
+import zlib
+from types import ModuleType
 
 from .exceptions import UnsafePathError
 
+_libdeflate: ModuleType | None
+try:
+    import deflate as _deflate_module  # Optional: libdeflate bindings (faster CRC-32)
+
+    _libdeflate = _deflate_module
+except ImportError:  # pragma: no cover - depends on environment
+    _libdeflate = None
+
 # Size parsing patterns
 _SIZE_PATTERN = re.compile(
     r"^\s*(\d+(?:\.\d+)?)\s*(b|kb|mb|gb|tb|kib|mib|gib|tib|bytes?)?\s*$",
@@ -31,6 +40,22 @@ _SIZE_MULTIPLIERS: dict[str, int] = {
     "tib": 1024**4,
 }
 
+# (divisor, suffix) pairs for format_size, indexed by unit magnitude
+_DECIMAL_UNITS: tuple[tuple[int, str], ...] = (
+    (1, "B"),
+    (1000, "KB"),
+    (1000**2, "MB"),
+    (1000**3, "GB"),
+    (1000**4, "TB"),
+)
+_BINARY_UNITS: tuple[tuple[int, str], ...] = (
+    (1, "B"),
+    (1024, "KiB"),
+    (1024**2, "MiB"),
+    (1024**3, "GiB"),
+    (1024**4, "TiB"),
+)
+
 
 def parse_size(size: int | float | str) -> int:
     """
@@ -76,6 +101,11 @@ def parse_size(size: int | float | str) -> int:
     if isinstance(size, float):
         return int(size)
 
+    # Plain byte counts ("104857600") don't need the regex
+    stripped = size.strip()
+    if stripped.isascii() and stripped.isdigit():
+        return int(stripped)
+
     match = _SIZE_PATTERN.match(size)
     if not match:
         raise ValueError(
@@ -90,11 +120,11 @@ def parse_size(size: int | float | str) -> int:
         # No unit specified, assume bytes
         return int(value)
 
-    unit_lower = unit.lower()
-    if unit_lower not in _SIZE_MULTIPLIERS:
+    multiplier = _SIZE_MULTIPLIERS.get(unit.lower())
+    if multiplier is None:
         raise ValueError(f"Unknown size unit: '{unit}'")
 
-    return int(value * _SIZE_MULTIPLIERS[unit_lower])
+    return int(value * multiplier)
 
 
 def format_size(size: int, binary: bool = False) -> str:
@@ -114,20 +144,23 @@ def format_size(size: int, binary: bool = False) -> str:
         >>> format_size(1572864, binary=True)
         '1.50 MiB'
     """
+    magnitude = int(abs(size))
     if binary:
-        units = ["B", "KiB", "MiB", "GiB", "TiB"]
-        divisor = 1024.0
+        # Each binary unit is 2**10, so the bit length picks the unit directly
+        index = (magnitude.bit_length() - 1) // 10
+        units = _BINARY_UNITS
     else:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        divisor = 1000.0
-
-    value = float(size)
-    for unit in units[:-1]:
-        if abs(value) < divisor:
-            return f"{value:.2f} {unit}" if value != int(value) else f"{int(value)} {unit}"
-        value /= divisor
+        # Each decimal unit is 10**3, so the digit count picks the unit directly
+        index = (len(str(magnitude)) - 1) // 3
+        units = _DECIMAL_UNITS
 
-    return f"{value:.2f} {units[-1]}"
+    last = len(units) - 1
+    divisor, unit = units[min(max(index, 0), last)]
+    value = size / divisor
+    if index < last and value == int(value):
+        return f"{int(value)} {unit}"
+    # The largest unit always shows two decimals
+    return f"{value:.2f} {unit}"
 
 
 def dos_datetime(timestamp: float | None = None) -> tuple[int, int]:
@@ -140,18 +173,36 @@ def dos_datetime(timestamp: float | None = None) -> tuple[int, int]:
     Returns:
         Tuple of (dos_time, dos_date) as 16-bit integers.
     """
-    if timestamp is None:
-        timestamp = time.time()
-
-    t = time.localtime(timestamp)
+    # Unpack the struct_time as a tuple; cheaper than six attribute lookups
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
 
     # DOS time: bits 0-4 = seconds/2, bits 5-10 = minute, bits 11-15 = hour
-    dos_time = (t.tm_sec // 2) | (t.tm_min << 5) | (t.tm_hour << 11)
-
     # DOS date: bits 0-4 = day, bits 5-8 = month, bits 9-15 = year - 1980
-    dos_date = t.tm_mday | (t.tm_mon << 5) | ((t.tm_year - 1980) << 9)
+    return (
+        (second >> 1) | (minute << 5) | (hour << 11),
+        day | (month << 5) | ((year - 1980) << 9),
+    )
 
-    return dos_time, dos_date
+
+def crc32_update(crc: int, data: bytes | bytearray | memoryview) -> int:
+    """
+    Update a running CRC-32 with a block of data.
+
+    Uses libdeflate's vectorized CRC-32 when the optional ``deflate`` package
+    is installed, otherwise ``zlib.crc32``. Pass whole buffers rather than
+    small slices to stay in the fast inner loop.
+
+    Args:
+        crc: CRC-32 of the preceding data (0 to start).
+        data: Bytes-like object to fold into the checksum.
+
+    Returns:
+        Updated CRC-32 value.
+    """
+    if _libdeflate is not None:
+        result: int = _libdeflate.crc32(data, crc)
+        return result
+    return zlib.crc32(data, crc)
 
 
 def sanitize_arcname(path: str) -> str:
@@ -168,42 +219,72 @@ def sanitize_arcname(path: str) -> str:
     Returns:
         Sanitized archive name.
     """
+    return encode_arcname(path)[0]
+
+
+def encode_arcname(path: str) -> tuple[str, bytes]:
+    """
+    Sanitize a path and encode it as a UTF-8 archive member name.
+
+    Same rules as sanitize_arcname(); the encoded form needed for the length
+    check is returned so callers don't encode the name again.
+
+    Args:
+        path: Original path string.
+
+    Returns:
+        Tuple of (sanitized name, UTF-8 encoded name).
+    """
     # Reject null bytes
     if "\x00" in path:
         raise UnsafePathError(path)
 
-    # Convert backslashes to forward slashes
-    name = path.replace("\\", "/")
+    # Convert backslashes to forward slashes (rare outside Windows paths)
+    name = path.replace("\\", "/") if "\\" in path else path
 
     # Remove drive letter (e.g., "C:/")
     if len(name) >= 2 and name[1] == ":":
         name = name[2:]
 
-    # Remove leading slashes
-    name = name.lstrip("/")
+    # Resolve . and .. segments and drop empty ones (leading, trailing and
+    # repeated slashes) in a single pass; a .. above the root is an escape
+    parts: list[str] = []
+    for part in name.split("/"):
+        if part == "..":
+            if not parts:
+                raise UnsafePathError(path)
+            parts.pop()
+        elif part and part != ".":
+            parts.append(part)
+    name = "/".join(parts)
 
-    # Normalize multiple slashes
-    while "//" in name:
-        name = name.replace("//", "/")
+    # Validate archive name length (ZIP format limit)
+    encoded = name.encode("utf-8")
+    if len(encoded) > 65535:
+        raise ValueError(f"Archive name too long ({len(encoded)} bytes, max 65535)")
 
-    # Collapse .. segments
-    name = posixpath.normpath(name)
+    return name, encoded
 
-    # Strip leading /
-    name = name.lstrip("/")
 
-    # Reject if it escapes root
-    if name == ".." or name.startswith("../"):
-        raise UnsafePathError(path)
+def join_arcname(prefix: str, prefix_bytes: bytes, name: str) -> tuple[str, bytes]:
+    """
+    Append one directory listing name to an already sanitized archive prefix.
 
-    # normpath of empty string is "."
-    if name == ".":
-        name = ""
+    Gives the same result as encode_arcname(f"{prefix}/{name}") without walking
+    the prefix again; names that need sanitizing themselves take the slow path.
+    The name always follows a "/", so a root-level "C:foo" is kept as is.
 
-    # Validate archive name length (ZIP format limit)
-    if len(name.encode("utf-8")) > 65535:
-        raise ValueError(
-            f"Archive name too long ({len(name.encode('utf-8'))} bytes, max 65535)"
-        )
+    Args:
+        prefix: Sanitized directory name ending in "/", or "" at the root.
+        prefix_bytes: UTF-8 encoding of prefix.
+        name: File or directory name, as returned by os.scandir().
 
-    return name
+    Returns:
+        Tuple of (sanitized name, UTF-8 encoded name).
+    """
+    if "\\" in name or "\x00" in name or name in ("", ".", ".."):
+        return encode_arcname(f"{prefix}/{name}")
+    encoded = prefix_bytes + name.encode("utf-8")
+    if len(encoded) > 65535:
+        raise ValueError(f"Archive name too long ({len(encoded)} bytes, max 65535)")
+    return prefix + name, encoded
@@ -2,16 +2,77 @@
 
 from __future__ import annotations
 
+import os
+import queue
 import sys
+import threading
 import warnings
 from pathlib import Path
-from typing import BinaryIO, Callable
+from typing import BinaryIO, Callable, Union
 
 from .exceptions import VolumeTooSmallError
 
 # Minimum volume size: need room for at least a local file header + some data
 MIN_VOLUME_SIZE = 64 * 1024  # 64 KB minimum
 
+# Write buffer per volume file: coalesces small header writes into large syscalls
+DEFAULT_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+# Chunks queued for the background writer thread before write() blocks
+_WRITE_QUEUE_DEPTH = 8
+
+_Buffer = Union[bytes, bytearray, memoryview]
+
+# Maximum number of buffers accepted by one writev() call
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - platform dependent
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:  # pragma: no cover - sysconf reports "no limit" as -1
+    _IOV_MAX = 1024
+
+
+def _coalesce_patches(patches: list[tuple[int, bytes]]) -> list[tuple[int, bytes]]:
+    """Sort patches by offset and merge runs that are back to back."""
+    merged: list[tuple[int, bytes]] = []
+    for offset, data in sorted(patches, key=lambda patch: patch[0]):
+        if merged:
+            last_offset, last_data = merged[-1]
+            if last_offset + len(last_data) == offset:
+                merged[-1] = (last_offset, last_data + data)
+                continue
+        merged.append((offset, data))
+    return merged
+
+
+def _write_patches(path: Path, patches: list[tuple[int, bytes]]) -> None:
+    """Write (offset, data) pairs into an existing file, one pwrite() each."""
+    if not hasattr(os, "pwrite"):  # pragma: no cover - Windows
+        with open(path, "r+b") as f:
+            for offset, data in patches:
+                f.seek(offset)
+                f.write(data)
+        return
+
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        for offset, data in patches:
+            written = os.pwrite(fd, data, offset)
+            while written < len(data):  # pragma: no cover - short writes are rare
+                written += os.pwrite(fd, data[written:], offset + written)
+    finally:
+        os.close(fd)
+
+
+def _sync_file(path: Path) -> None:
+    """Flush a closed file's data to stable storage."""
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        # fdatasync() skips the timestamp-only metadata writes fsync() forces
+        getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+
 
 class VolumeManager:
     """
@@ -29,6 +90,10 @@ class VolumeManager:
         base_path: str | Path,
         split_size: int,
         on_volume_created: Callable[[int, Path], None] | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        preallocate: bool = False,
+        async_writes: bool = False,
+        sync_on_close: bool = False,
     ) -> None:
         """
         Initialize volume manager.
@@ -39,6 +104,17 @@ class VolumeManager:
             split_size: Maximum size of each volume in bytes.
             on_volume_created: Optional callback called when a new volume is created.
                               Receives (volume_number, volume_path).
+            buffer_size: Size in bytes of the write buffer for each volume file.
+            preallocate: Reserve split_size bytes on disk for each split volume when
+                it is opened (posix_fallocate), trimming it to the bytes actually
+                written when it is closed. Ignored where unsupported.
+            async_writes: Hand volume writes to a background thread so the caller
+                can compress the next chunk while the previous one goes to disk.
+                The thread is drained at volume boundaries, before patches and
+                on close(); its errors are raised from the next write().
+            sync_on_close: Make close() flush every volume to stable storage
+                (fdatasync) after the final header patches. Off by default;
+                volumes are otherwise left to normal OS write-back.
 
         Raises:
             VolumeTooSmallError: If split_size is below minimum.
@@ -47,17 +123,44 @@ class VolumeManager:
             raise VolumeTooSmallError(split_size, MIN_VOLUME_SIZE)
 
         self.base_path = Path(base_path)
+        # Split volume names share everything but the number: "<stem>.z" + "01"
+        self._volume_parent = self.base_path.parent
+        self._volume_stem = f"{self.base_path.stem}.z"
         self.split_size = split_size
         self.on_volume_created = on_volume_created
+        self.buffer_size = buffer_size
+        self.preallocate = preallocate and hasattr(os, "posix_fallocate")
+        self.sync_on_close = sync_on_close
 
         self._current_volume: int = 0
         self._current_file: BinaryIO | None = None
         self._bytes_written_to_volume: int = 0
+        # split_size - _bytes_written_to_volume, or sys.maxsize in the final volume;
+        # kept up to date by every write so the hot path needs no arithmetic
+        self._space_remaining: int = split_size
         self._total_bytes_written: int = 0
         self._volume_paths: list[Path] = []
+        # Deferred write_at_offset() patches: volume number -> [(offset, data)]
+        self._pending_patches: dict[int, list[tuple[int, bytes]]] = {}
         self._is_final_volume: bool = False
+        # Whether the open volume was preallocated and needs trimming on close
+        self._preallocated: bool = False
+        self._warned_volume_count: bool = False
         self._closed: bool = False
 
+        # Writes to the open volume: its write() method, or _enqueue() when a
+        # background thread does the I/O
+        self._emit: Callable[[_Buffer], object] = self._enqueue
+        self._write_queue: queue.Queue[tuple[BinaryIO, bytes] | None] | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+        if async_writes:
+            self._write_queue = queue.Queue(maxsize=_WRITE_QUEUE_DEPTH)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="splitzip-writer", daemon=True
+            )
+            self._writer_thread.start()
+
     @property
     def current_volume(self) -> int:
         """Current volume number (0-indexed)."""
@@ -84,11 +187,8 @@ class VolumeManager:
         return self._volume_paths.copy()
 
     def space_remaining(self) -> int:
-        """Bytes remaining in current volume."""
-        if self._is_final_volume:
-            # Final volume has no size limit
-            return sys.maxsize
-        return self.split_size - self._bytes_written_to_volume
+        """Bytes remaining in current volume (sys.maxsize in the final volume)."""
+        return self._space_remaining
 
     def volume_path_for(self, volume_number: int, is_final: bool = False) -> Path:
         """
@@ -110,24 +210,96 @@ class VolumeManager:
         if is_final:
             return self.base_path
 
-        stem = self.base_path.stem
-        parent = self.base_path.parent
         # .z01, .z02, etc. (1-indexed in filename)
-        return parent / f"{stem}.z{volume_number + 1:02d}"
+        return self._volume_parent / f"{self._volume_stem}{volume_number + 1:02d}"
+
+    def _writer_loop(self) -> None:
+        """Background thread: write queued chunks in order until the None sentinel."""
+        assert self._write_queue is not None
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                if self._writer_error is None:
+                    file, data = item
+                    file.write(data)
+            except BaseException as exc:  # re-raised on the caller's thread
+                self._writer_error = exc
+            finally:
+                self._write_queue.task_done()
+
+    def _enqueue(self, data: _Buffer) -> None:
+        """Queue a chunk for the background writer."""
+        if self._writer_error is not None:
+            raise self._writer_error
+        assert self._write_queue is not None and self._current_file is not None
+        # The caller may reuse its buffer (e.g. a read buffer) once we return
+        chunk = data if type(data) is bytes else bytes(data)
+        self._write_queue.put((self._current_file, chunk))
+
+    def _drain(self) -> None:
+        """Wait until the background writer has written everything queued."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+            if self._writer_error is not None:
+                raise self._writer_error
+
+    def _stop_writer(self) -> None:
+        """Stop the background writer thread, if one is running."""
+        if self._writer_thread is not None:
+            assert self._write_queue is not None
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def _bind_emit(self) -> None:
+        """Point _emit at the newly opened volume file."""
+        if self._write_queue is None:
+            assert self._current_file is not None
+            self._emit = self._current_file.write
+
+    def _close_current(self) -> None:
+        """Close the open volume file, trimming any preallocated space."""
+        assert self._current_file is not None
+        try:
+            self._drain()
+            if self._preallocated:
+                self._current_file.flush()
+                os.ftruncate(self._current_file.fileno(), self._bytes_written_to_volume)
+                self._preallocated = False
+        finally:
+            self._current_file.close()
 
     def _open_volume(self, volume_number: int, is_final: bool = False) -> None:
         """Open a new volume file for writing."""
         if self._current_file is not None:
-            self._current_file.close()
+            self._close_current()
 
         path = self.volume_path_for(volume_number, is_final)
-        self._current_file = Path(path).open("wb")  # noqa: SIM115
+        # A split volume never holds more than split_size bytes, so a larger
+        # buffer would only be allocated and never filled
+        buffering = self.buffer_size if is_final else min(self.buffer_size, self.split_size)
+        self._current_file = Path(path).open("wb", buffering=buffering)  # noqa: SIM115
+        self._bind_emit()
+        if self.preallocate and not is_final:
+            # One extent reservation instead of growing the file write by write.
+            # The final volume's size is unknown, so it is left to grow.
+            try:
+                os.posix_fallocate(self._current_file.fileno(), 0, self.split_size)
+                self._preallocated = True
+            except OSError:  # pragma: no cover - filesystem without fallocate
+                pass
         self._current_volume = volume_number
         self._bytes_written_to_volume = 0
+        # Final volume has no size limit
+        self._space_remaining = sys.maxsize if is_final else self.split_size
         self._is_final_volume = is_final
         self._volume_paths.append(path)
 
-        if not is_final and volume_number >= 99:
+        if not is_final and volume_number >= 99 and not self._warned_volume_count:
+            # Once per archive; warn() walks the stack on every call
+            self._warned_volume_count = True
             warnings.warn(
                 f"Volume count exceeds 99 ({volume_number + 1} volumes). "
                 "Some ZIP tools may not handle 3+ digit extensions.",
@@ -151,7 +323,7 @@ class VolumeManager:
         if self._is_final_volume:
             return
         self._ensure_open()
-        if self.space_remaining() < nbytes:
+        if self._space_remaining < nbytes:
             self.next_volume()
 
     def next_volume(self) -> None:
@@ -183,25 +355,30 @@ class VolumeManager:
         # If we only have one volume so far and it's not full, we can rename it
         # to be the final .zip file instead of creating .z01 + .zip
         if len(self._volume_paths) == 1 and self._bytes_written_to_volume < self.split_size:
-            # Close current file
-            self._current_file.close()
-
-            # Rename from .z01 to .zip
             old_path = self._volume_paths[0]
             new_path = self.base_path
 
-            if old_path != new_path:
+            if os.name == "nt":  # pragma: no cover - Windows
+                # An open file can't be renamed here: close (trimmed, so the
+                # append starts at the data end), rename, reopen for append
+                self._close_current()
+                if old_path != new_path:
+                    old_path.rename(new_path)
+                self._current_file = new_path.open("ab", buffering=self.buffer_size)  # noqa: SIM115
+                self._bind_emit()
+            elif old_path != new_path:
+                # Rename from .z01 to .zip; the open descriptor follows the
+                # inode, so writing simply continues
                 old_path.rename(new_path)
-                self._volume_paths[0] = new_path
+            self._volume_paths[0] = new_path
 
-            # Reopen in append mode
-            self._current_file = new_path.open("ab")  # noqa: SIM115
+            self._space_remaining = sys.maxsize
             self._is_final_volume = True
         else:
             # Need a separate final volume
             self._open_volume(self._current_volume + 1, is_final=True)
 
-    def write(self, data: bytes) -> None:
+    def write(self, data: bytes | bytearray | memoryview) -> None:
         """
         Write data to the current volume, potentially spanning volumes.
 
@@ -216,33 +393,84 @@ class VolumeManager:
         if self._closed:
             raise RuntimeError("VolumeManager is closed")
 
-        self._ensure_open()
-        assert self._current_file is not None
+        if self._current_file is None:
+            self._open_volume(0)
 
-        remaining = data
-        while remaining:
-            space = self.space_remaining()
-
-            if space >= len(remaining) or self._is_final_volume:
-                # All data fits (or we're in final volume with unlimited space)
-                self._current_file.write(remaining)
-                self._bytes_written_to_volume += len(remaining)
-                self._total_bytes_written += len(remaining)
-                break
-            elif space > 0:
-                # Write what fits
-                chunk = remaining[:space]
-                self._current_file.write(chunk)
-                self._bytes_written_to_volume += len(chunk)
-                self._total_bytes_written += len(chunk)
-                remaining = remaining[space:]
-                # Move to next volume
-                self.next_volume()
-            else:
-                # No space, move to next volume
+        size = len(data)
+        space = self._space_remaining
+        if space >= size:
+            # Common case: fits in the current volume (always true in the final one)
+            self._emit(data)
+            self._bytes_written_to_volume += size
+            self._total_bytes_written += size
+            if not self._is_final_volume:
+                self._space_remaining = space - size
+            return
+
+        # Spans volumes: hand out O(1) memoryview slices instead of copying the
+        # tail, and keep the counters in locals until the last volume is reached.
+        # The view is released even on error, so a traceback can't pin data
+        # (a memory-mapped source can't be unmapped while views of it exist)
+        with memoryview(data) as view:
+            split_size = self.split_size
+            emit = self._emit
+            pos = 0
+            while size - pos > space:
+                emit(view[pos : pos + space])
+                pos += space
+                # The volume is now exactly full (_close_current trims to this count)
+                self._bytes_written_to_volume = split_size
                 self.next_volume()
+                emit = self._emit  # bound to the new volume's file
+                space = split_size
+
+            # Never reached in the final volume, which has no limit
+            tail = size - pos
+            emit(view[pos:])
+        self._bytes_written_to_volume = tail
+        self._space_remaining = space - tail
+        self._total_bytes_written += size
 
-    def write_at_offset(self, data: bytes, volume: int, offset: int) -> None:
+    def writev(self, buffers: list[bytes]) -> None:
+        """
+        Write several buffers in order, using scatter-gather I/O when possible.
+
+        In the final volume (which has no size limit) the buffers go straight
+        to os.writev(), so N buffers cost one syscall instead of N writes.
+        Elsewhere, or on platforms without os.writev(), they are joined and
+        written with write().
+
+        Args:
+            buffers: Byte strings to write, in order.
+        """
+        if self._closed:
+            raise RuntimeError("VolumeManager is closed")
+
+        if not self._is_final_volume or not hasattr(os, "writev"):
+            self.write(b"".join(buffers))
+            return
+
+        assert self._current_file is not None
+        self._drain()
+        self._current_file.flush()
+        fd = self._current_file.fileno()
+
+        views = [memoryview(buf) for buf in buffers if buf]
+        index = 0
+        while index < len(views):
+            written = os.writev(fd, views[index : index + _IOV_MAX])
+            self._bytes_written_to_volume += written
+            self._total_bytes_written += written
+            # Skip fully written buffers; trim a partially written one
+            while index < len(views) and written >= len(views[index]):
+                written -= len(views[index])
+                index += 1
+            if written:
+                views[index] = views[index][written:]
+
+    def write_at_offset(
+        self, data: bytes, volume: int, offset: int, defer: bool = False
+    ) -> None:
         """
         Write data at a specific location (for patching headers).
 
@@ -253,34 +481,61 @@ class VolumeManager:
             data: Bytes to write.
             volume: Volume number.
             offset: Byte offset within the volume.
+            defer: Queue the patch and apply it in flush_patches() (called by
+                close()), so each volume is opened once for all its patches.
+                Deferred patches must not overlap.
         """
-        is_final = volume == self._current_volume and self._is_final_volume
-        path = self.volume_path_for(volume, is_final=is_final)
-        if (
-            path not in self._volume_paths
-            and not (self._is_final_volume and volume == self._current_volume)
-        ):
+        # Volumes are numbered in creation order, so the number is the index
+        # into _volume_paths (which also tracks the .z01 -> .zip rename)
+        if not 0 <= volume < len(self._volume_paths):
             raise ValueError(f"Volume {volume} has not been created")
 
+        if defer:
+            self._pending_patches.setdefault(volume, []).append((offset, data))
+            return
+
         # Need to flush current file before patching
         if self._current_file:
+            self._drain()
             self._current_file.flush()
 
-        with open(path, "r+b") as f:
-            f.seek(offset)
-            f.write(data)
+        _write_patches(self._volume_paths[volume], [(offset, data)])
+
+    def flush_patches(self) -> None:
+        """Apply patches queued with write_at_offset(defer=True)."""
+        if not self._pending_patches:
+            return
+
+        if self._current_file is not None:
+            self._drain()
+            self._current_file.flush()
+
+        for volume, patches in sorted(self._pending_patches.items()):
+            _write_patches(self._volume_paths[volume], _coalesce_patches(patches))
+        self._pending_patches.clear()
 
     def close(self) -> list[Path]:
         """
         Close all volumes and return the list of created paths.
 
+        Deferred patches are applied once the last volume is closed.
+
         Returns:
             List of paths to all volume files created.
         """
-        if self._current_file is not None:
-            self._current_file.close()
-            self._current_file = None
-        self._closed = True
+        try:
+            if self._current_file is not None:
+                try:
+                    self._close_current()
+                finally:
+                    self._current_file = None
+            self.flush_patches()
+            if self.sync_on_close:
+                for path in self._volume_paths:
+                    _sync_file(path)
+        finally:
+            self._stop_writer()
+            self._closed = True
         return self._volume_paths.copy()
 
     def __enter__(self) -> VolumeManager:
@@ -2,29 +2,410 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+import os
+import queue
+import struct
+import threading
 import warnings
 import zlib
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, suppress
 from pathlib import Path
-from typing import BinaryIO, Callable
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+from types import ModuleType
+from typing import BinaryIO, Callable, Protocol, Union
 
 from .exceptions import SplitZipError
 from .structures import (
     Compression,
+    DataDescriptor,
     EndOfCentralDirectory,
     GeneralPurposeFlag,
     LocalFileHeader,
     ZipEntry,
 )
-from .utils import dos_datetime, parse_size, sanitize_arcname
-from .volume import VolumeManager
+from .utils import (
+    crc32_update,
+    dos_datetime,
+    encode_arcname,
+    join_arcname,
+    parse_size,
+    sanitize_arcname,
+)
+from .volume import DEFAULT_BUFFER_SIZE, VolumeManager
+
+_libdeflate: ModuleType | None
+try:
+    import deflate as _deflate_module  # Optional: libdeflate bindings (faster DEFLATE)
+
+    _libdeflate = _deflate_module
+except ImportError:  # pragma: no cover - depends on environment
+    _libdeflate = None
 
 # Default chunk size for reading files
-CHUNK_SIZE = 64 * 1024  # 64 KB
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Already-compressed formats, stored rather than deflated by default
+DEFAULT_STORE_SUFFIXES = frozenset({
+    ".7z", ".bz2", ".gz", ".jpeg", ".jpg", ".mkv", ".mov", ".mp3", ".mp4",
+    ".png", ".webm", ".webp", ".xz", ".zip", ".zst",
+})
+
+# libdeflate only compresses whole buffers; use it for inputs up to this size
+_WHOLE_BUFFER_LIMIT = 1024 * 1024  # 1 MiB
+
+# Files of at least this many chunks are read by a background thread when
+# read_ahead is on
+_READ_AHEAD_MIN_CHUNKS = 4
+# Chunks the read-ahead thread may fill before the consumer catches up
+_READ_AHEAD_DEPTH = 2
+
+# Files up to this size are compressed in memory and written with their
+# header in a single call
+_SMALL_FILE_LIMIT = 64 * 1024  # 64 KiB
+
+# Input block size and back-reference window for multi-threaded DEFLATE
+_PARALLEL_BLOCK_SIZE = 128 * 1024  # 128 KB
+_DEFLATE_WINDOW = 32 * 1024  # 32 KB
 
 # ZIP32 limits
 _MAX_32 = 0xFFFFFFFF  # 4,294,967,295 bytes
 _MAX_ENTRIES = 0xFFFF  # 65,535 entries
 
+# CRC, compressed size and uncompressed size, at offset 14 of a local header
+_PATCH_STRUCT = struct.Struct("<III")
+_PATCH_OFFSET = 14
+
+
+class _Compressor(Protocol):
+    """Streaming compressor interface (matches ``zlib.compressobj``)."""
+
+    def compress(self, data: bytes | bytearray | memoryview, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _LibdeflateCompressor:
+    """
+    Streaming facade over libdeflate's whole-buffer compressor.
+
+    Input is accumulated until flush(), then compressed in a single call.
+    Only handed out for inputs expected to be small (see _WHOLE_BUFFER_LIMIT);
+    the expectation comes from a size hint, so if the input outgrows the
+    limit anyway the rest is streamed through zlib to keep memory bounded.
+    """
+
+    def __init__(self, compresslevel: int) -> None:
+        self._compresslevel = compresslevel
+        self._buffer = bytearray()
+        self._stream: _Compressor | None = None
+
+    def compress(self, data: bytes | bytearray | memoryview, /) -> bytes:
+        if self._stream is not None:
+            return self._stream.compress(data)
+        self._buffer += data
+        if len(self._buffer) <= _WHOLE_BUFFER_LIMIT:
+            return b""
+        # Larger than the hint promised: continue as a zlib stream
+        self._stream = zlib.compressobj(self._compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = self._stream.compress(self._buffer)
+        self._buffer = bytearray()
+        return compressed
+
+    def flush(self) -> bytes:
+        if self._stream is not None:
+            return self._stream.flush()
+        assert _libdeflate is not None
+        compressed: bytes = _libdeflate.deflate_compress(self._buffer, self._compresslevel)
+        self._buffer = bytearray()
+        return compressed
+
+
+def _name_flags(arcname: str) -> int:
+    """General purpose flags for an entry name: the UTF-8 bit only if it is non-ASCII."""
+    return 0 if arcname.isascii() else GeneralPurposeFlag.UTF8
+
+
+def _deflate_block(block: bytes, dictionary: bytes, compresslevel: int, last: bool) -> bytes:
+    """
+    Compress one block of a multi-threaded DEFLATE stream.
+
+    The block is primed with the preceding 32 KB of input so back-references
+    can cross block boundaries. Every block but the last ends with a sync
+    flush (byte-aligned, no final bit), so the outputs concatenate into a
+    single valid stream.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(
+            compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    mode = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(block) + compressor.flush(mode)
+
+
+class _ParallelCompressor:
+    """
+    Streaming DEFLATE compressor that spreads blocks across a thread pool.
+
+    Input is cut into fixed-size blocks which are compressed concurrently
+    (zlib releases the GIL while compressing); output is returned strictly
+    in input order, so the result does not depend on thread scheduling.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, compresslevel: int, workers: int) -> None:
+        self._executor = executor
+        self._compresslevel = compresslevel
+        self._max_pending = workers * 2
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._pending: deque[Future[bytes]] = deque()
+
+    def compress(self, data: bytes | bytearray | memoryview, /) -> bytes:
+        self._buffer += data
+        while len(self._buffer) >= _PARALLEL_BLOCK_SIZE:
+            block = bytes(self._buffer[:_PARALLEL_BLOCK_SIZE])
+            del self._buffer[:_PARALLEL_BLOCK_SIZE]
+            self._submit(block, last=False)
+        return self._collect(wait=False)
+
+    def flush(self) -> bytes:
+        self._submit(bytes(self._buffer), last=True)
+        self._buffer = bytearray()
+        self._dictionary = b""
+        return self._collect(wait=True)
+
+    def _submit(self, block: bytes, last: bool) -> None:
+        self._pending.append(
+            self._executor.submit(
+                _deflate_block, block, self._dictionary, self._compresslevel, last
+            )
+        )
+        self._dictionary = block[-_DEFLATE_WINDOW:]
+
+    def _collect(self, wait: bool) -> bytes:
+        """Pop finished blocks in order; block on the oldest while too many are queued."""
+        out: list[bytes] = []
+        pending = self._pending
+        while pending and (wait or pending[0].done() or len(pending) > self._max_pending):
+            out.append(pending.popleft().result())
+        return b"".join(out)
+
+
+class _Readable(Protocol):
+    """Source file interface used by the chunk readers (raw or buffered files)."""
+
+    def readinto(self, buffer: bytearray | memoryview, /) -> int | None: ...
+
+
+# _compress_file() result: (compression, crc32, uncompressed_size, payload)
+_Compressed = tuple[int, int, int, bytes]
+_Precompressed = Future[Union[_Compressed, None]]
+
+
+def _streamed_flags(flags: int, compression: int) -> int:
+    """
+    Flags for an entry whose CRC and sizes are only known after its data.
+
+    DEFLATE entries get a trailing data descriptor, keeping the output purely
+    sequential. STORED entries keep having their header patched instead, since
+    streaming readers can't find the end of stored data without the sizes.
+    """
+    if compression == Compression.DEFLATED:
+        return flags | GeneralPurposeFlag.DATA_DESCRIPTOR
+    return flags
+
+
+def _compress_file(
+    path: str, compression: int, compresslevel: int, limit: int
+) -> _Compressed | None:
+    """
+    Read and compress a whole (small) file, also run on the worker pool.
+
+    Data that DEFLATE would not make smaller is stored instead. At most
+    limit bytes are read into memory: a file that has grown past that since
+    it was stat'ed is left to the streaming path.
+
+    Returns:
+        Tuple of (compression used, crc32, uncompressed_size, payload), or
+        None if the file holds more than limit bytes.
+    """
+    with open(path, "rb") as f:
+        data = f.read(limit + 1)
+    if len(data) > limit:
+        return None
+    crc = crc32_update(0, data) & 0xFFFFFFFF
+    compressor = _new_compressor(compression, compresslevel, len(data))
+    if compressor is not None:
+        payload = compressor.compress(data) + compressor.flush()
+        if len(payload) < len(data):
+            return compression, crc, len(data), payload
+    return Compression.STORED, crc, len(data), data
+
+
+def _read_chunks(f: _Readable, buffer: bytearray) -> Generator[memoryview, None, None]:
+    """Yield successive chunks of f, read into (and viewed from) one reused buffer."""
+    with memoryview(buffer) as view:
+        while True:
+            nread = f.readinto(view)
+            if not nread:
+                return
+            yield view[:nread]
+
+
+def _mapped_chunks(fd: int, chunk_size: int) -> Generator[memoryview, None, None]:
+    """
+    Yield successive chunks of an open file as views of a read-only memory map.
+
+    CRC and compression read straight from the page cache, without copying
+    into a buffer first. Each yielded chunk is released when the next one is
+    requested, so the map can be closed.
+    """
+    if os.fstat(fd).st_size == 0:
+        return  # empty files can't be mapped
+    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    try:
+        if hasattr(mapped, "madvise"):  # not on Windows
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), chunk_size):
+                with view[start : start + chunk_size] as chunk:
+                    yield chunk
+    except BaseException:
+        # The error's traceback may still reference views of the map, and
+        # closing would then raise BufferError in place of the original
+        # error; the map is unmapped when those views are collected instead
+        with suppress(BufferError):
+            mapped.close()
+        raise
+    mapped.close()
+
+
+def _walk_directory(
+    path: Path, prefix: str
+) -> Generator[tuple[os.DirEntry[str], str, bytes], None, None]:
+    """
+    Yield the contents of a directory tree with their archive names.
+
+    Entries come depth-first in name order, each directory just before its
+    contents; symlinks are skipped with a warning. The walk keeps a stack of
+    open listings instead of recursing, so deep trees need no Python frames.
+    DirEntry caches the file type reported by readdir(), so the checks here
+    don't stat each item.
+    """
+    def listing(directory: str | Path) -> Iterator[os.DirEntry[str]]:
+        with os.scandir(directory) as it:
+            return iter(sorted(it, key=lambda item: item.name))
+
+    stack = [(listing(path), prefix, prefix.encode("utf-8"))]
+    while stack:
+        items, prefix, prefix_bytes = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        if item.is_symlink():
+            warnings.warn(f"Skipping symlink: '{item.path}'", stacklevel=3)
+            continue
+        # Children are named by appending to the sanitized, encoded prefix
+        arcname, arcname_bytes = join_arcname(prefix, prefix_bytes, item.name)
+        yield item, arcname, arcname_bytes
+        if item.is_dir(follow_symlinks=False):
+            stack.append((listing(item.path), f"{arcname}/", arcname_bytes + b"/"))
+
+
+_ReadItem = Union[tuple[bytearray, int], BaseException, None]
+
+
+def _read_ahead(f: _Readable, chunk_size: int) -> Generator[memoryview, None, None]:
+    """
+    Yield successive chunks of f while a background thread reads the next ones.
+
+    The reader fills a small ring of buffers (readinto() releases the GIL), so
+    disk reads overlap with CRC and compression on the consuming thread. A
+    yielded chunk stays valid until the next one is requested.
+    """
+    free: queue.Queue[bytearray] = queue.Queue()
+    for _ in range(_READ_AHEAD_DEPTH + 1):
+        free.put(bytearray(chunk_size))
+    full: queue.Queue[_ReadItem] = queue.Queue()
+    stop = threading.Event()
+
+    def reader() -> None:
+        try:
+            while True:
+                buf = free.get()
+                if stop.is_set():
+                    return
+                nread = f.readinto(buf)
+                full.put((buf, nread) if nread else None)
+                if not nread:
+                    return
+        except BaseException as exc:  # handed to the consumer
+            full.put(exc)
+
+    thread = threading.Thread(target=reader, name="splitzip-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = full.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            buf, nread = item
+            with memoryview(buf) as view:
+                yield view[:nread]
+            # The consumer asked for the next chunk, so this buffer is free again
+            free.put(buf)
+    finally:
+        stop.set()
+        free.put(bytearray())  # wake the reader if it is waiting for a buffer
+        thread.join()
+
+
+def _new_compressor(
+    compression: int,
+    compresslevel: int,
+    size_hint: int | None = None,
+    executor: ThreadPoolExecutor | None = None,
+    workers: int = 1,
+) -> _Compressor | None:
+    """
+    Create a compressor for one entry.
+
+    Args:
+        compression: Compression method.
+        compresslevel: DEFLATE compression level.
+        size_hint: Expected uncompressed size, if known.
+        executor: Thread pool for multi-threaded DEFLATE, if enabled.
+        workers: Number of threads in executor.
+
+    Returns:
+        A compressor, or None for STORED entries.
+    """
+    if compression != Compression.DEFLATED:
+        return None
+    if _libdeflate is not None and size_hint is not None and size_hint <= _WHOLE_BUFFER_LIMIT:
+        return _LibdeflateCompressor(compresslevel)
+    if executor is not None and (size_hint is None or size_hint > _PARALLEL_BLOCK_SIZE):
+        return _ParallelCompressor(executor, compresslevel, workers)
+    return zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+
+def _deflate(data: bytes, compresslevel: int) -> bytes:
+    """Compress an in-memory buffer to raw DEFLATE in one call."""
+    if _libdeflate is not None:
+        compressed: bytes = _libdeflate.deflate_compress(data, compresslevel)
+        return compressed
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
 
 class SplitZipWriter:
     """
@@ -55,6 +436,15 @@ class SplitZipWriter:
         compresslevel: int = 6,
         on_volume: Callable[[int, Path], None] | None = None,
         on_progress: Callable[[str, int, int], None] | None = None,
+        volume_buffer_size: int = DEFAULT_BUFFER_SIZE,
+        workers: int = 1,
+        preallocate: bool = False,
+        async_writes: bool = False,
+        sync_on_close: bool = False,
+        read_ahead: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        memory_map: bool = False,
+        store_suffixes: Iterable[str] = DEFAULT_STORE_SUFFIXES,
     ) -> None:
         """
         Initialize a split ZIP writer.
@@ -69,33 +459,80 @@ class SplitZipWriter:
             on_volume: Callback when a volume is created. Receives (volume_number, path).
             on_progress: Callback for progress updates.
                 Receives (filename, bytes_done, total_bytes).
+            volume_buffer_size: Write buffer size in bytes for each volume file
+                (default 1 MiB).
+            workers: Number of threads used to DEFLATE large entries, and to
+                compress small files of a directory ahead of writing them
+                (default 1: compress on the calling thread). Output is identical
+                for any value greater than 1.
+            preallocate: Reserve each split volume's full size on disk up front
+                (posix_fallocate where available) to limit fragmentation.
+            async_writes: Write volume files from a background thread, overlapping
+                disk I/O with reading and compressing the next chunk.
+            sync_on_close: Flush all volumes to stable storage (fdatasync) when
+                the archive is closed.
+            read_ahead: Read large files on a background thread so the next
+                chunk is loaded while the current one is compressed.
+            chunk_size: Bytes read and compressed per step (default 1 MiB).
+            memory_map: Read large files through mmap instead of copying them
+                into a buffer (read_ahead is then not used). Files must not be
+                truncated while being added: reading past the new end of a
+                mapped file kills the process.
+            store_suffixes: File name suffixes (such as ".jpg") of formats that
+                are already compressed; DEFLATE entries with these suffixes are
+                stored instead, unless compression is given for the entry.
+                Matched case-insensitively. Pass () to deflate everything.
         """
         if compression not in (Compression.STORED, Compression.DEFLATED):
             raise ValueError(
                 f"Unsupported compression method: {compression}. "
                 "Use Compression.STORED or Compression.DEFLATED."
             )
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self._check_compresslevel(compresslevel)
 
         self.path = Path(path)
         self.split_size = parse_size(split_size)
         self.compression = compression
         self.compresslevel = compresslevel
         self.on_progress = on_progress
+        self.workers = workers
+        self.read_ahead = read_ahead
+        self.chunk_size = chunk_size
+        self.memory_map = memory_map
+        self.store_suffixes = frozenset(suffix.lower() for suffix in store_suffixes)
 
         self._volume_mgr = VolumeManager(
             self.path,
             self.split_size,
             on_volume_created=on_volume,
+            buffer_size=volume_buffer_size,
+            preallocate=preallocate,
+            async_writes=async_writes,
+            sync_on_close=sync_on_close,
         )
         self._entries: list[ZipEntry] = []
         self._closed = False
         self._closing = False
+        # Reused for every file read to avoid a fresh bytes object per chunk
+        self._read_buffer = bytearray(chunk_size)
+        # Timestamp for entries without an mtime (writestr, write_fileobj)
+        self._default_datetime = dos_datetime()
+        # Created on first use when workers > 1
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def volume_paths(self) -> list[Path]:
         """List of all volume paths created so far."""
         return self._volume_mgr.volume_paths
 
+    def namelist(self) -> list[str]:
+        """Return the names of the entries written so far, in archive order."""
+        return [entry.filename for entry in self._entries]
+
     def write(
         self,
         path: str | Path,
@@ -117,21 +554,29 @@ class SplitZipWriter:
         Raises:
             FileNotFoundError: If path does not exist.
             IsADirectoryError: If path is a directory and recursive=False.
+            ValueError: If compresslevel is not between 1 and 9.
         """
         self._check_closed()
+        if compresslevel is not None:
+            self._check_compresslevel(compresslevel)
         path = Path(path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        # One lstat() answers exists / is_symlink / is_dir and feeds the entry
+        try:
+            stat = os.lstat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No such file or directory: '{path}'") from None
 
-        if path.is_symlink():
+        if S_ISLNK(stat.st_mode):
+            if not path.exists():
+                raise FileNotFoundError(f"No such file or directory: '{path}'")
             warnings.warn(f"Skipping symlink: '{path}'", stacklevel=2)
             return
 
-        if path.is_dir():
-            self._write_directory(path, arcname, recursive, compression, compresslevel)
+        if S_ISDIR(stat.st_mode):
+            self._write_directory(path, arcname, recursive, compression, compresslevel, stat)
         else:
-            self._write_file(path, arcname, compression, compresslevel)
+            self._write_file(path, stat, arcname, compression, compresslevel)
 
     def _write_directory(
         self,
@@ -140,6 +585,7 @@ class SplitZipWriter:
         recursive: bool,
         compression: int | None,
         compresslevel: int | None,
+        stat: os.stat_result,
     ) -> None:
         """Add a directory to the archive."""
         base_arcname = arcname if arcname else path.name
@@ -147,42 +593,82 @@ class SplitZipWriter:
 
         # Add the directory entry itself
         dir_arcname = base_arcname.rstrip("/") + "/"
-        self._write_directory_entry(dir_arcname, path)
+        self._write_directory_entry(dir_arcname, stat)
 
         if not recursive:
             return
 
-        # Add contents
-        for item in sorted(path.iterdir()):
-            if item.is_symlink():
-                warnings.warn(f"Skipping symlink: '{item}'", stacklevel=2)
-                continue
-            item_arcname = f"{base_arcname.rstrip('/')}/{item.name}"
-            if item.is_dir():
-                self._write_directory(item, item_arcname, True, compression, compresslevel)
-            else:
-                self._write_file(item, item_arcname, compression, compresslevel)
+        # With workers > 1, small files are read and compressed on the pool
+        # while the entries before them are written; output order is unchanged
+        level = compresslevel if compresslevel is not None else self.compresslevel
+        window: deque[tuple[os.DirEntry[str], str, bytes, _Precompressed | None]] = deque()
+        depth = 2 * self.workers if self.workers > 1 else 1
+        prefix = f"{base_arcname}/" if base_arcname else ""
+
+        for item, item_arcname, item_arcname_bytes in _walk_directory(path, prefix):
+            future = None
+            if (
+                self.workers > 1
+                and self._entry_compression(item_arcname, compression) == Compression.DEFLATED
+                and self._can_precompress(item)
+            ):
+                future = self._get_executor().submit(
+                    _compress_file, item.path, Compression.DEFLATED, level, self.chunk_size
+                )
+            window.append((item, item_arcname, item_arcname_bytes, future))
+            if len(window) >= depth:
+                self._write_walked(*window.popleft(), compression, compresslevel)
+        while window:
+            self._write_walked(*window.popleft(), compression, compresslevel)
+
+    def _write_walked(
+        self,
+        item: os.DirEntry[str],
+        arcname: str,
+        arcname_bytes: bytes,
+        precompressed: _Precompressed | None,
+        compression: int | None,
+        compresslevel: int | None,
+    ) -> None:
+        """Write one entry found by _walk_directory()."""
+        if item.is_dir(follow_symlinks=False):
+            self._write_directory_entry(f"{arcname}/", item.stat(follow_symlinks=False))
+        else:
+            self._write_file(
+                Path(item.path), item.stat(follow_symlinks=False), arcname,
+                compression, compresslevel, precompressed, arcname_bytes,
+            )
+
+    def _entry_compression(self, arcname: str, compression: int | None) -> int:
+        """Compression for an entry: the override, else by suffix (see store_suffixes)."""
+        if compression is not None:
+            return compression
+        if self.compression == Compression.DEFLATED and self.store_suffixes:
+            dot = arcname.rfind(".")
+            if dot > arcname.rfind("/") and arcname[dot:].lower() in self.store_suffixes:
+                return Compression.STORED
+        return self.compression
+
+    def _can_precompress(self, item: os.DirEntry[str]) -> bool:
+        """Whether a directory item is a regular file small enough to compress whole."""
+        try:
+            return (
+                item.is_file(follow_symlinks=False)
+                and item.stat(follow_symlinks=False).st_size <= self.chunk_size
+            )
+        except OSError:
+            # Left to the sequential path, which reports the error in order
+            return False
 
-    def _write_directory_entry(self, arcname: str, path: Path) -> None:
-        """Write a directory entry (no data, just metadata)."""
+    def _write_directory_entry(self, arcname: str, stat: os.stat_result) -> None:
+        """Write a directory entry (no data, just metadata) from the directory's stat."""
         self._check_entry_limit()
         arcname_bytes = arcname.encode("utf-8")
-        stat = path.stat()
+        flags = _name_flags(arcname)
         mod_time, mod_date = dos_datetime(stat.st_mtime)
 
         # Directory entry uses STORED, no data
-        header = LocalFileHeader(
-            version_needed=20,
-            flags=GeneralPurposeFlag.UTF8,
-            compression=Compression.STORED,
-            mod_time=mod_time,
-            mod_date=mod_date,
-            crc32=0,
-            compressed_size=0,
-            uncompressed_size=0,
-            filename=arcname_bytes,
-        )
-        header_bytes = header.to_bytes()
+        header_bytes = LocalFileHeader.dir_bytes(arcname_bytes, mod_time, mod_date, flags)
 
         self._volume_mgr.ensure_space(len(header_bytes))
         disk_start = self._volume_mgr.current_volume
@@ -205,28 +691,33 @@ class SplitZipWriter:
             disk_number_start=disk_start,
             local_header_offset=offset,
             external_attr=external_attr,
+            flags=flags,
         )
         self._entries.append(entry)
 
     def _write_file(
         self,
         path: Path,
+        stat: os.stat_result,
         arcname: str | None,
         compression: int | None,
         compresslevel: int | None,
+        precompressed: _Precompressed | None = None,
+        arcname_bytes: bytes | None = None,
     ) -> None:
-        """Write a single file to the archive."""
-        if path.is_symlink():
-            warnings.warn(f"Skipping symlink: '{path}'", stacklevel=2)
-            return
+        """
+        Write a single file to the archive.
 
+        stat is path's lstat() result from write() or a directory scan; the
+        caller has already skipped symlinks. precompressed, if given, is a
+        pending _compress_file() result for path. arcname_bytes, if given,
+        means arcname is already sanitized and this is its UTF-8 encoding.
+        """
         self._check_entry_limit()
 
-        arcname = arcname if arcname else path.name
-        arcname = sanitize_arcname(arcname)
-        arcname_bytes = arcname.encode("utf-8")
+        if arcname is None or arcname_bytes is None:
+            arcname, arcname_bytes = encode_arcname(arcname if arcname else path.name)
 
-        stat = path.stat()
         mod_time, mod_date = dos_datetime(stat.st_mtime)
         file_size = stat.st_size
 
@@ -236,20 +727,36 @@ class SplitZipWriter:
                 "ZIP64 not supported."
             )
 
-        comp = compression if compression is not None else self.compression
+        comp = self._entry_compression(arcname, compression)
         level = compresslevel if compresslevel is not None else self.compresslevel
 
-        # Write header with placeholder values (will patch after data is written)
-        flags = GeneralPurposeFlag.UTF8
+        flags = _name_flags(arcname)
+        whole: _Compressed | None = None
+        if precompressed is not None:
+            # Compressed ahead on the pool
+            whole = precompressed.result()
+        elif file_size <= _SMALL_FILE_LIMIT and S_ISREG(stat.st_mode):
+            # Regular files only: a FIFO or device reports no meaningful size
+            whole = _compress_file(str(path), comp, level, _SMALL_FILE_LIMIT)
+
+        if whole is not None:
+            # Data already in memory, so the header can carry the final values
+            comp, crc, uncompressed_size, payload = whole
+            compressed_size = len(payload)
+        else:
+            # Placeholders, filled in once the data is written (see _finish_data)
+            crc = compressed_size = uncompressed_size = 0
+            flags = _streamed_flags(flags, comp)
+
         header = LocalFileHeader(
             version_needed=20,
             flags=flags,
             compression=comp,
             mod_time=mod_time,
             mod_date=mod_date,
-            crc32=0,  # Will be updated
-            compressed_size=0,  # Will be updated
-            uncompressed_size=file_size,
+            crc32=crc,
+            compressed_size=compressed_size,
+            uncompressed_size=uncompressed_size,
             filename=arcname_bytes,
         )
         header_bytes = header.to_bytes()
@@ -258,17 +765,26 @@ class SplitZipWriter:
         self._volume_mgr.ensure_space(len(header_bytes))
         disk_start = self._volume_mgr.current_volume
         header_offset = self._volume_mgr.current_offset
-        self._volume_mgr.write(header_bytes)
-
-        # Compress and write data
-        crc, compressed_size, uncompressed_size = self._write_file_data(
-            path, comp, level, file_size
-        )
 
-        # Patch the header with actual values
-        self._patch_local_header(
-            disk_start, header_offset, crc, compressed_size, uncompressed_size
-        )
+        if whole is not None:
+            if compressed_size <= _SMALL_FILE_LIMIT:
+                # Header and data in one write; only the header must not span volumes
+                self._volume_mgr.write(header_bytes + payload)
+            else:
+                # Precompressed up to chunk_size; joining would copy it all
+                self._volume_mgr.write(header_bytes)
+                self._volume_mgr.write(payload)
+            if self.on_progress:
+                self.on_progress(str(path), uncompressed_size, uncompressed_size)
+        else:
+            # Compress and write data
+            self._volume_mgr.write(header_bytes)
+            crc, compressed_size, uncompressed_size = self._write_file_data(
+                path, comp, level, file_size
+            )
+            self._finish_data(
+                flags, disk_start, header_offset, crc, compressed_size, uncompressed_size
+            )
 
         # External attr: Unix permissions
         external_attr = (stat.st_mode & 0o777) << 16
@@ -286,6 +802,7 @@ class SplitZipWriter:
             disk_number_start=disk_start,
             local_header_offset=header_offset,
             external_attr=external_attr,
+            flags=flags,
         )
         self._entries.append(entry)
 
@@ -306,37 +823,39 @@ class SplitZipWriter:
         uncompressed_size = 0
         compressed_size = 0
 
-        if compression == Compression.DEFLATED:
-            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
-        else:
-            compressor = None
-
-        with open(path, "rb") as f:
-            while True:
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
-                    break
-
-                crc = zlib.crc32(chunk, crc)
+        compressor = self._new_compressor(compression, compresslevel, total_size)
+        # Bound once for the loop; the callback gets the same str every chunk
+        write = self._volume_mgr.write
+        progress = self.on_progress
+        filename = str(path)
+
+        # Unbuffered, so chunks are read straight into our buffer rather than
+        # copied through io's; closing() stops a read-ahead thread before the
+        # file is closed
+        with open(path, "rb", buffering=0) as f, closing(
+            self._file_chunks(f, total_size)
+        ) as chunks:
+            for chunk in chunks:
+                crc = crc32_update(crc, chunk)
                 uncompressed_size += len(chunk)
 
                 if compressor:
                     compressed_chunk = compressor.compress(chunk)
                     if compressed_chunk:
-                        self._volume_mgr.write(compressed_chunk)
+                        write(compressed_chunk)
                         compressed_size += len(compressed_chunk)
                 else:
-                    self._volume_mgr.write(chunk)
+                    write(chunk)
                     compressed_size += len(chunk)
 
-                if self.on_progress:
-                    self.on_progress(str(path), uncompressed_size, total_size)
+                if progress is not None:
+                    progress(filename, uncompressed_size, total_size)
 
             # Flush compressor
             if compressor:
                 remaining = compressor.flush()
                 if remaining:
-                    self._volume_mgr.write(remaining)
+                    write(remaining)
                     compressed_size += len(remaining)
 
         if compressed_size > _MAX_32 or uncompressed_size > _MAX_32:
@@ -347,6 +866,57 @@ class SplitZipWriter:
 
         return crc & 0xFFFFFFFF, compressed_size, uncompressed_size
 
+    def _file_chunks(self, f: io.FileIO, size: int) -> Generator[memoryview, None, None]:
+        """Chunk iterator for a source file: mapped, read ahead or read in place."""
+        if self.memory_map:
+            return _mapped_chunks(f.fileno(), self.chunk_size)
+        if self.read_ahead and size >= _READ_AHEAD_MIN_CHUNKS * self.chunk_size:
+            return _read_ahead(f, self.chunk_size)
+        return _read_chunks(f, self._read_buffer)
+
+    def _new_compressor(
+        self, compression: int, compresslevel: int, size_hint: int | None
+    ) -> _Compressor | None:
+        """Create a compressor for one entry, using the thread pool if enabled."""
+        executor = self._get_executor() if self.workers > 1 else None
+        return _new_compressor(compression, compresslevel, size_hint, executor, self.workers)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the compression thread pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="splitzip"
+            )
+        return self._executor
+
+    def _shutdown_executor(self) -> None:
+        """Stop the compression thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _finish_data(
+        self,
+        flags: int,
+        disk: int,
+        offset: int,
+        crc: int,
+        compressed_size: int,
+        uncompressed_size: int,
+    ) -> None:
+        """
+        Record an entry's CRC and sizes once its data has been written.
+
+        Entries flagged with a data descriptor get one appended after their
+        data; the rest have their local header patched.
+        """
+        if flags & GeneralPurposeFlag.DATA_DESCRIPTOR:
+            descriptor = DataDescriptor(crc, compressed_size, uncompressed_size).to_bytes()
+            self._volume_mgr.ensure_space(len(descriptor))
+            self._volume_mgr.write(descriptor)
+        else:
+            self._patch_local_header(disk, offset, crc, compressed_size, uncompressed_size)
+
     def _patch_local_header(
         self,
         disk: int,
@@ -356,12 +926,9 @@ class SplitZipWriter:
         uncompressed_size: int,
     ) -> None:
         """Patch the local file header with actual CRC and sizes."""
-        import struct
-
-        # CRC, compressed size, uncompressed size are at offset 14 in the header
-        patch_offset = offset + 14
-        patch_data = struct.pack("<III", crc, compressed_size, uncompressed_size)
-        self._volume_mgr.write_at_offset(patch_data, disk, patch_offset)
+        patch_data = _PATCH_STRUCT.pack(crc, compressed_size, uncompressed_size)
+        # Queued and applied per volume when the archive is closed
+        self._volume_mgr.write_at_offset(patch_data, disk, offset + _PATCH_OFFSET, defer=True)
 
     def writestr(
         self,
@@ -380,6 +947,8 @@ class SplitZipWriter:
             compresslevel: Override compression level.
         """
         self._check_closed()
+        if compresslevel is not None:
+            self._check_compresslevel(compresslevel)
         self._check_entry_limit()
 
         if isinstance(data, str):
@@ -390,27 +959,30 @@ class SplitZipWriter:
                 f"Data size {len(data)} bytes exceeds 4GB ZIP32 limit. ZIP64 not supported."
             )
 
-        arcname = sanitize_arcname(arcname)
-        arcname_bytes = arcname.encode("utf-8")
-        mod_time, mod_date = dos_datetime()
+        arcname, arcname_bytes = encode_arcname(arcname)
+        flags = _name_flags(arcname)
+        mod_time, mod_date = self._default_datetime
 
-        comp = compression if compression is not None else self.compression
+        comp = self._entry_compression(arcname, compression)
         level = compresslevel if compresslevel is not None else self.compresslevel
 
-        crc = zlib.crc32(data) & 0xFFFFFFFF
+        crc = crc32_update(0, data) & 0xFFFFFFFF
         uncompressed_size = len(data)
 
-        if comp == Compression.DEFLATED and len(data) > CHUNK_SIZE:
-            # Stream compress large buffers to avoid doubling memory
+        chunk_size = self.chunk_size
+        if comp == Compression.DEFLATED and len(data) > chunk_size:
+            # Stream compress large buffers to avoid doubling memory; the
+            # CRC and sizes follow the data (see _finish_data)
+            flags = _streamed_flags(flags, comp)
             header = LocalFileHeader(
                 version_needed=20,
-                flags=GeneralPurposeFlag.UTF8,
+                flags=flags,
                 compression=comp,
                 mod_time=mod_time,
                 mod_date=mod_date,
-                crc32=crc,
-                compressed_size=0,  # Will be patched
-                uncompressed_size=uncompressed_size,
+                crc32=0,
+                compressed_size=0,
+                uncompressed_size=0,
                 filename=arcname_bytes,
             )
             header_bytes = header.to_bytes()
@@ -420,34 +992,37 @@ class SplitZipWriter:
             header_offset = self._volume_mgr.current_offset
             self._volume_mgr.write(header_bytes)
 
-            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            compressor = self._new_compressor(comp, level, uncompressed_size)
+            assert compressor is not None
             compressed_size = 0
-            for i in range(0, len(data), CHUNK_SIZE):
-                chunk = compressor.compress(data[i : i + CHUNK_SIZE])
-                if chunk:
-                    self._volume_mgr.write(chunk)
-                    compressed_size += len(chunk)
+            # Slices of a memoryview don't copy the input
+            with memoryview(data) as view:
+                for i in range(0, len(view), chunk_size):
+                    chunk = compressor.compress(view[i : i + chunk_size])
+                    if chunk:
+                        self._volume_mgr.write(chunk)
+                        compressed_size += len(chunk)
             remaining = compressor.flush()
             if remaining:
                 self._volume_mgr.write(remaining)
                 compressed_size += len(remaining)
 
-            self._patch_local_header(
-                disk_start, header_offset, crc, compressed_size, uncompressed_size
+            self._finish_data(
+                flags, disk_start, header_offset, crc, compressed_size, uncompressed_size
             )
         else:
-            # Small data or STORED: compress upfront
-            if comp == Compression.DEFLATED:
-                compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
-                compressed = compressor.compress(data) + compressor.flush()
-            else:
+            # Small data or STORED: compress upfront, storing data that DEFLATE
+            # would not make smaller
+            compressed = _deflate(data, level) if comp == Compression.DEFLATED else data
+            if len(compressed) >= len(data):
+                comp = Compression.STORED
                 compressed = data
 
             compressed_size = len(compressed)
 
             header = LocalFileHeader(
                 version_needed=20,
-                flags=GeneralPurposeFlag.UTF8,
+                flags=flags,
                 compression=comp,
                 mod_time=mod_time,
                 mod_date=mod_date,
@@ -461,8 +1036,13 @@ class SplitZipWriter:
             self._volume_mgr.ensure_space(len(header_bytes))
             disk_start = self._volume_mgr.current_volume
             header_offset = self._volume_mgr.current_offset
-            self._volume_mgr.write(header_bytes)
-            self._volume_mgr.write(compressed)
+            if compressed_size <= _SMALL_FILE_LIMIT:
+                # Header and data in one write; only the header must not span volumes
+                self._volume_mgr.write(header_bytes + compressed)
+            else:
+                # Joining would copy the whole payload
+                self._volume_mgr.write(header_bytes)
+                self._volume_mgr.write(compressed)
 
         # Track entry
         entry = ZipEntry(
@@ -477,6 +1057,7 @@ class SplitZipWriter:
             disk_number_start=disk_start,
             local_header_offset=header_offset,
             external_attr=0o644 << 16,  # Default file permissions
+            flags=flags,
         )
         self._entries.append(entry)
 
@@ -492,26 +1073,30 @@ class SplitZipWriter:
         Write data from a file-like object to the archive.
 
         Args:
-            fileobj: File-like object with read() method.
+            fileobj: File-like object with read() (or readinto()) method.
             arcname: Name of file in archive.
-            size: Total size if known (for progress callback).
+            size: Total size if known (for progress callback; also a hint for
+                choosing the compressor, so it need not be exact).
             compression: Override compression method.
             compresslevel: Override compression level.
         """
         self._check_closed()
+        if compresslevel is not None:
+            self._check_compresslevel(compresslevel)
         self._check_entry_limit()
 
-        arcname = sanitize_arcname(arcname)
-        arcname_bytes = arcname.encode("utf-8")
-        mod_time, mod_date = dos_datetime()
+        arcname, arcname_bytes = encode_arcname(arcname)
+        flags = _name_flags(arcname)
+        mod_time, mod_date = self._default_datetime
 
-        comp = compression if compression is not None else self.compression
+        comp = self._entry_compression(arcname, compression)
         level = compresslevel if compresslevel is not None else self.compresslevel
 
-        # Write header with placeholders
+        # Write header with placeholders (see _finish_data)
+        flags = _streamed_flags(flags, comp)
         header = LocalFileHeader(
             version_needed=20,
-            flags=GeneralPurposeFlag.UTF8,
+            flags=flags,
             compression=comp,
             mod_time=mod_time,
             mod_date=mod_date,
@@ -532,36 +1117,42 @@ class SplitZipWriter:
         uncompressed_size = 0
         compressed_size = 0
 
-        if comp == Compression.DEFLATED:
-            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressor = self._new_compressor(comp, level, size)
+
+        # Read into the reused buffer when the object supports it
+        chunks: Iterator[bytes | memoryview]
+        if hasattr(fileobj, "readinto"):
+            chunks = _read_chunks(fileobj, self._read_buffer)
         else:
-            compressor = None
+            chunk_size = self.chunk_size
+            chunks = iter(lambda: fileobj.read(chunk_size), b"")
 
-        while True:
-            chunk = fileobj.read(CHUNK_SIZE)
-            if not chunk:
-                break
+        write = self._volume_mgr.write
+        # Progress needs a known total
+        total = size or 0
+        progress = self.on_progress if total else None
 
-            crc = zlib.crc32(chunk, crc)
+        for chunk in chunks:
+            crc = crc32_update(crc, chunk)
             uncompressed_size += len(chunk)
 
             if compressor:
                 compressed_chunk = compressor.compress(chunk)
                 if compressed_chunk:
-                    self._volume_mgr.write(compressed_chunk)
+                    write(compressed_chunk)
                     compressed_size += len(compressed_chunk)
             else:
-                self._volume_mgr.write(chunk)
+                write(chunk)
                 compressed_size += len(chunk)
 
-            if self.on_progress and size:
-                self.on_progress(arcname, uncompressed_size, size)
+            if progress is not None:
+                progress(arcname, uncompressed_size, total)
 
         # Flush compressor
         if compressor:
             remaining = compressor.flush()
             if remaining:
-                self._volume_mgr.write(remaining)
+                write(remaining)
                 compressed_size += len(remaining)
 
         crc = crc & 0xFFFFFFFF
@@ -572,8 +1163,7 @@ class SplitZipWriter:
                 f"uncompressed={uncompressed_size}). ZIP64 not supported."
             )
 
-        # Patch header
-        self._patch_local_header(disk_start, header_offset, crc, compressed_size, uncompressed_size)
+        self._finish_data(flags, disk_start, header_offset, crc, compressed_size, uncompressed_size)
 
         # Track entry
         entry = ZipEntry(
@@ -588,6 +1178,7 @@ class SplitZipWriter:
             disk_number_start=disk_start,
             local_header_offset=header_offset,
             external_attr=0o644 << 16,
+            flags=flags,
         )
         self._entries.append(entry)
 
@@ -605,22 +1196,18 @@ class SplitZipWriter:
         if self._closing:
             return self._volume_mgr.volume_paths
         self._closing = True
+        self._shutdown_executor()
 
         # Start final volume for central directory
         self._volume_mgr.start_final_volume()
 
-        # Write central directory
+        # Serialize central directory
         cd_start_disk = self._volume_mgr.current_volume
         cd_start_offset = self._volume_mgr.current_offset
-        cd_size = 0
+        cd_buffers = [entry.to_central_directory_header().to_bytes() for entry in self._entries]
+        cd_size = sum(len(cd_bytes) for cd_bytes in cd_buffers)
 
-        for entry in self._entries:
-            cd_header = entry.to_central_directory_header()
-            cd_bytes = cd_header.to_bytes()
-            self._volume_mgr.write(cd_bytes)
-            cd_size += len(cd_bytes)
-
-        # Write end of central directory
+        # End of central directory follows it in the same scatter-gather write
         eocd = EndOfCentralDirectory(
             disk_number=self._volume_mgr.current_volume,
             disk_with_cd_start=cd_start_disk,
@@ -629,7 +1216,8 @@ class SplitZipWriter:
             cd_size=cd_size,
             cd_offset=cd_start_offset,
         )
-        self._volume_mgr.write(eocd.to_bytes())
+        cd_buffers.append(eocd.to_bytes())
+        self._volume_mgr.writev(cd_buffers)
 
         self._closed = True
         return self._volume_mgr.close()
@@ -639,6 +1227,11 @@ class SplitZipWriter:
         if self._closed:
             raise RuntimeError("SplitZipWriter is closed")
 
+    def _check_compresslevel(self, compresslevel: int) -> None:
+        """Raise unless compresslevel is a DEFLATE level every backend accepts."""
+        if not 1 <= compresslevel <= 9:
+            raise ValueError(f"compresslevel must be between 1 and 9, got {compresslevel}")
+
     def _check_entry_limit(self) -> None:
         """Raise if entry count exceeds ZIP32 limit."""
         if len(self._entries) >= _MAX_ENTRIES:
@@ -651,6 +1244,7 @@ class SplitZipWriter:
         if exc_type is not None:
             # Error path: release file handles without writing central directory
             self._closed = True
+            self._shutdown_executor()
             self._volume_mgr.close()
         else:
             self.close()
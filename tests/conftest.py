@@ -0,0 +1,40 @@
+"""Shared pytest fixtures and options."""
+
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# RAM-backed scratch space on Linux; elsewhere the default temp directory
+_TMPFS = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-external", action="store_true",
+        help="run tests that extract archives with external tools (unzip, 7z)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-external"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-external")
+    for item in items:
+        if "external" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory(dir=_TMPFS) as td:
+        yield Path(td)
+
+
+@pytest.fixture(scope="session")
+def random_blob():
+    """Deterministic incompressible bytes, generated once and sliced by tests."""
+    return random.Random(42).randbytes(2 * 1024 * 1024)
@@ -1,7 +1,9 @@
 """Tests for the CLI interface."""
 
-import pytest
+import subprocess
+import sys
 
+from splitzip import __version__
 from splitzip.__main__ import main
 
 
@@ -15,9 +17,18 @@ class TestCLI:
         assert "usage" in captured.out.lower() or "splitzip" in captured.out.lower()
 
     def test_version(self, capsys):
-        with pytest.raises(SystemExit) as exc_info:
-            main(["--version"])
-        assert exc_info.value.code == 0
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out.strip() == f"splitzip {__version__}"
+
+    def test_import_defers_writer(self):
+        code = (
+            "import sys, splitzip; "
+            "assert 'splitzip.writer' not in sys.modules; "
+            "assert 'concurrent.futures' not in sys.modules; "
+            "splitzip.SplitZipWriter; "
+            "assert 'splitzip.writer' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
     def test_create_nonexistent_file(self, tmp_path, capsys):
         result = main([
@@ -1,5 +1,7 @@
 """Tests for ZIP data structures."""
 
+import sys
+
 import pytest
 
 from splitzip.structures import (
@@ -8,6 +10,7 @@ from splitzip.structures import (
     DataDescriptor,
     EndOfCentralDirectory,
     LocalFileHeader,
+    ZipEntry,
 )
 
 
@@ -52,6 +55,23 @@ class TestLocalFileHeader:
         header = LocalFileHeader(filename=b"test.txt", extra=b"extra")
         assert header.total_size == 30 + 8 + 5  # fixed + filename + extra
 
+    def test_extra_roundtrip(self):
+        header = LocalFileHeader(filename=b"test.txt", extra=b"\x55\x54\x01\x00\x00")
+        data = header.to_bytes()
+        assert len(data) == header.total_size
+        parsed = LocalFileHeader.from_bytes(data)
+        assert parsed.filename == b"test.txt"
+        assert parsed.extra == header.extra
+
+    def test_dir_bytes(self):
+        header = LocalFileHeader(
+            flags=0x800, compression=Compression.STORED, mod_time=0x6000, mod_date=0x5821,
+            filename="dír/".encode(),
+        )
+        assert LocalFileHeader.dir_bytes("dír/".encode(), 0x6000, 0x5821, 0x800) == (
+            header.to_bytes()
+        )
+
     def test_invalid_signature(self):
         bad_data = b"\x00\x00\x00\x00" + b"\x00" * 26
         with pytest.raises(ValueError, match="Invalid local file header signature"):
@@ -91,6 +111,21 @@ class TestCentralDirectoryHeader:
         assert parsed.comment == header.comment
         assert parsed.external_attr == header.external_attr
 
+    def test_variable_fields_roundtrip(self):
+        header = CentralDirectoryHeader(
+            filename=b"dir/name.bin",
+            extra=b"\x01\x00\x04\x00abcd",
+            comment=b"note",
+        )
+
+        data = header.to_bytes()
+        parsed = CentralDirectoryHeader.from_bytes(data)
+
+        assert len(data) == header.total_size
+        assert parsed.filename == header.filename
+        assert parsed.extra == header.extra
+        assert parsed.comment == header.comment
+
     def test_signature(self):
         header = CentralDirectoryHeader(filename=b"test.txt")
         data = header.to_bytes()
@@ -128,6 +163,11 @@ class TestEndOfCentralDirectory:
         data = eocd.to_bytes()
         assert data[0:4] == b"\x50\x4b\x05\x06"
 
+    def test_no_comment(self):
+        data = EndOfCentralDirectory(total_entries=3).to_bytes()
+        assert len(data) == EndOfCentralDirectory.FIXED_SIZE
+        assert EndOfCentralDirectory.from_bytes(data).comment == b""
+
 
 class TestDataDescriptor:
     """Tests for DataDescriptor."""
@@ -152,3 +192,31 @@ class TestDataDescriptor:
 
         data = dd.to_bytes(include_signature=False)
         assert len(data) == 12
+
+
+class TestZipEntry:
+    """Tests for ZipEntry."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_slots(self):
+        entry = ZipEntry(
+            filename="a.txt", arcname=b"a.txt", compression=0, mod_time=0, mod_date=0
+        )
+        assert not hasattr(entry, "__dict__")
+
+    def test_to_central_directory_header(self):
+        entry = ZipEntry(
+            filename="a.txt",
+            arcname=b"a.txt",
+            compression=Compression.STORED,
+            mod_time=1,
+            mod_date=2,
+            crc32=0xDEADBEEF,
+            compressed_size=5,
+            uncompressed_size=5,
+            local_header_offset=100,
+        )
+        cdh = entry.to_central_directory_header()
+        assert cdh.filename == b"a.txt"
+        assert cdh.crc32 == 0xDEADBEEF
+        assert cdh.local_header_offset == 100
@@ -1,9 +1,20 @@
 """Tests for utility functions."""
 
+import zlib
+from unittest import mock
+
 import pytest
 
 from splitzip.exceptions import UnsafePathError
-from splitzip.utils import dos_datetime, format_size, parse_size, sanitize_arcname
+from splitzip.utils import (
+    crc32_update,
+    dos_datetime,
+    encode_arcname,
+    format_size,
+    join_arcname,
+    parse_size,
+    sanitize_arcname,
+)
 
 
 class TestParseSize:
@@ -41,6 +52,7 @@ class TestParseSize:
 
     def test_no_unit_assumes_bytes(self):
         assert parse_size("1024") == 1024
+        assert parse_size(" 104857600 ") == 104857600
 
     def test_whitespace_handling(self):
         assert parse_size("  100 MB  ") == 100_000_000
@@ -70,6 +82,15 @@ class TestFormatSize:
         assert format_size(1536, binary=True) == "1.50 KiB"
         assert format_size(1024 * 1024, binary=True) == "1 MiB"
 
+    def test_unit_boundaries(self):
+        assert format_size(999) == "999 B"
+        assert format_size(1000) == "1 KB"
+        assert format_size(1023, binary=True) == "1023 B"
+        assert format_size(-1500) == "-1.50 KB"
+        # The largest unit always shows two decimals, even past 1000
+        assert format_size(1000**4) == "1.00 TB"
+        assert format_size(1024**5, binary=True) == "1024.00 TiB"
+
 
 class TestDosDatetime:
     """Tests for DOS datetime conversion."""
@@ -97,6 +118,25 @@ class TestDosDatetime:
         assert year == 2024
 
 
+class TestCrc32Update:
+    """Tests for incremental CRC-32."""
+
+    def test_matches_zlib(self):
+        data = bytes(range(256)) * 100
+        crc = 0
+        for i in range(0, len(data), 1000):
+            crc = crc32_update(crc, data[i : i + 1000])
+        assert crc == zlib.crc32(data)
+
+    def test_accepts_memoryview(self):
+        data = b"hello world"
+        assert crc32_update(0, memoryview(data)) == zlib.crc32(data)
+
+    def test_zlib_fallback(self):
+        with mock.patch("splitzip.utils._libdeflate", None):
+            assert crc32_update(0, b"hello") == zlib.crc32(b"hello")
+
+
 class TestSanitizeArcname:
     """Tests for archive name sanitization."""
 
@@ -140,3 +180,24 @@ class TestSanitizeArcname:
     def test_null_byte_raises(self):
         with pytest.raises(UnsafePathError):
             sanitize_arcname("foo\x00bar")
+
+    def test_encode_arcname(self):
+        assert encode_arcname("dir\\日本語.txt") == ("dir/日本語.txt", "dir/日本語.txt".encode())
+
+    @pytest.mark.parametrize("prefix", ["", "dir/", "dir/日本/"])
+    @pytest.mark.parametrize("name", ["file.txt", "日本語.txt", "a\\b", "C:x", "."])
+    def test_join_arcname_matches_encode(self, prefix, name):
+        expected = encode_arcname(f"{prefix}/{name}")
+        assert join_arcname(prefix, prefix.encode(), name) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("C:foo", "C:foo"), ("C:", "C:"), ("C:\\x", "C:/x")],
+    )
+    def test_join_arcname_root_drive_letter(self, name, expected):
+        """At the root a name is still joined after "/", so no drive letter is stripped."""
+        assert join_arcname("", b"", name) == (expected, expected.encode())
+
+    def test_join_arcname_too_long(self):
+        with pytest.raises(ValueError, match="too long"):
+            join_arcname("dir/", b"dir/", "x" * 65535)
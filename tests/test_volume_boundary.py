@@ -1,25 +1,21 @@
 """Tests for volume boundary behavior."""
 
 import os
-import tempfile
+import sys
+import warnings
 import zipfile
-from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from splitzip import SplitZipWriter
-
-
-@pytest.fixture
-def temp_dir():
-    with tempfile.TemporaryDirectory() as td:
-        yield Path(td)
+from splitzip.volume import MIN_VOLUME_SIZE, VolumeManager
 
 
 class TestVolumeBoundary:
     """Tests for volume splitting behavior."""
 
-    def test_multiple_small_files_across_volumes(self, temp_dir):
+    def test_multiple_small_files_across_volumes(self, temp_dir, random_blob):
         """Small split size forces multiple volumes."""
         archive_path = temp_dir / "output" / "boundary.zip"
         archive_path.parent.mkdir()
@@ -27,16 +23,16 @@ class TestVolumeBoundary:
         # Create files that will exceed the split size
         with SplitZipWriter(archive_path, split_size="64KiB") as zf:
             for i in range(20):
-                zf.writestr(f"file_{i}.txt", os.urandom(8192))
+                zf.writestr(f"file_{i}.txt", random_blob[i * 8192 : (i + 1) * 8192])
 
         assert len(zf.volume_paths) > 1
 
-    def test_single_file_forces_split(self, temp_dir):
+    def test_single_file_forces_split(self, temp_dir, random_blob):
         """A file larger than split_size spans multiple volumes."""
         archive_path = temp_dir / "output" / "single_split.zip"
         archive_path.parent.mkdir()
 
-        data = os.urandom(200000)
+        data = random_blob[:200000]
         with SplitZipWriter(archive_path, split_size="64KiB") as zf:
             zf.writestr("big.bin", data)
 
@@ -44,7 +40,7 @@ class TestVolumeBoundary:
         # Final volume should be the .zip
         assert zf.volume_paths[-1].suffix == ".zip"
 
-    def test_header_does_not_span_volume_boundary(self, temp_dir):
+    def test_header_does_not_span_volume_boundary(self, temp_dir, random_blob):
         """Headers are pushed to the next volume when they would straddle a boundary."""
         archive_path = temp_dir / "output" / "headerboundary.zip"
         archive_path.parent.mkdir()
@@ -53,7 +49,7 @@ class TestVolumeBoundary:
         # whose header would straddle the boundary. ensure_space should push it.
         with SplitZipWriter(archive_path, split_size="64KiB") as zf:
             # Fill most of the first volume
-            zf.writestr("filler.bin", os.urandom(60000))
+            zf.writestr("filler.bin", random_blob[:60000])
             # This file's header should be pushed to the next volume
             zf.writestr("second.txt", b"hello world")
 
@@ -61,6 +57,203 @@ class TestVolumeBoundary:
         # Single-volume archives can be verified with zipfile.
         if len(zf.volume_paths) == 1:
             with zipfile.ZipFile(archive_path) as zf_std:
-                assert "filler.bin" in zf_std.namelist()
-                assert "second.txt" in zf_std.namelist()
+                assert zf_std.namelist() == ["filler.bin", "second.txt"]
                 assert zf_std.read("second.txt") == b"hello world"
+
+
+class TestVolumeManagerWrite:
+    """Tests for VolumeManager.write."""
+
+    def test_write_spans_several_volumes(self, temp_dir, random_blob):
+        """One write larger than several volumes is split exactly at split_size."""
+        base = temp_dir / "span.zip"
+        data = random_blob[: MIN_VOLUME_SIZE * 3 + 123]
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"head")
+            mgr.write(data)
+            assert mgr.total_bytes_written == len(data) + 4
+            assert mgr.current_offset == (len(data) + 4) % MIN_VOLUME_SIZE
+            assert mgr.space_remaining() == MIN_VOLUME_SIZE - mgr.current_offset
+            mgr.start_final_volume()
+            assert mgr.space_remaining() == sys.maxsize
+            paths = mgr.volume_paths
+
+        assert [p.stat().st_size for p in paths] == [MIN_VOLUME_SIZE] * 3 + [127, 0]
+        assert b"".join(p.read_bytes() for p in paths) == b"head" + data
+
+    def test_volume_count_warning_once(self, temp_dir):
+        """Going past 99 volumes warns once, not once per extra volume."""
+        base = temp_dir / "many.zip"
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+                mgr.write(bytes(MIN_VOLUME_SIZE * 102))
+                assert mgr.volume_count == 102
+
+        messages = [str(w.message) for w in caught]
+        assert len(messages) == 1
+        assert "exceeds 99" in messages[0]
+
+    @pytest.mark.parametrize("preallocate", [False, True])
+    def test_preallocate_trims_volumes(self, temp_dir, preallocate):
+        """Preallocated volumes end up exactly as large as the data written."""
+        base = temp_dir / "prealloc.zip"
+
+        with VolumeManager(base, MIN_VOLUME_SIZE, preallocate=preallocate) as mgr:
+            mgr.write(b"a" * (MIN_VOLUME_SIZE + 100))
+            mgr.ensure_space(MIN_VOLUME_SIZE)  # leaves the second volume part-filled
+            mgr.write(b"b" * 10)
+            mgr.start_final_volume()
+            mgr.write(b"cd")
+            paths = mgr.volume_paths
+
+        sizes = [p.stat().st_size for p in paths]
+        assert sizes == [MIN_VOLUME_SIZE, 100, 10, 2]
+
+    def test_preallocate_single_volume_rename(self, temp_dir):
+        """The .z01 -> .zip rename appends after the data, not the reservation."""
+        base = temp_dir / "single.zip"
+
+        with VolumeManager(base, MIN_VOLUME_SIZE, preallocate=True) as mgr:
+            mgr.write(b"data")
+            mgr.start_final_volume()
+            mgr.write(b"cd")
+
+        assert base.read_bytes() == b"datacd"
+
+    def test_sync_on_close(self, temp_dir):
+        """Every volume is synced once, after the deferred patches."""
+        base = temp_dir / "sync.zip"
+        mgr = VolumeManager(base, MIN_VOLUME_SIZE, sync_on_close=True)
+        mgr.write(b"\x00" * (MIN_VOLUME_SIZE + 1))
+        mgr.write_at_offset(b"A", 0, 0, defer=True)
+        mgr.start_final_volume()
+
+        sync = getattr(os, "fdatasync", os.fsync)
+        with mock.patch("splitzip.volume.os." + sync.__name__, wraps=sync) as synced:
+            paths = mgr.close()
+
+        assert synced.call_count == len(paths) == 3
+        assert paths[0].read_bytes()[:1] == b"A"
+
+
+class TestVolumeManagerAsyncWrites:
+    """Tests for the background writer thread."""
+
+    def test_async_matches_sync(self, temp_dir):
+        """Reused buffers, spanning writes and patches come out as in sync mode."""
+        outputs = []
+        for async_writes in (False, True):
+            base = temp_dir / f"async_{async_writes}" / "a.zip"
+            base.parent.mkdir()
+            buf = bytearray(1000)
+            with VolumeManager(base, MIN_VOLUME_SIZE, async_writes=async_writes) as mgr:
+                for i in range(200):
+                    buf[:] = bytes([i]) * 1000
+                    mgr.write(memoryview(buf))
+                mgr.write_at_offset(b"PATCH", 0, 10)
+                mgr.write_at_offset(b"DEFER", 1, 10, defer=True)
+                mgr.start_final_volume()
+                mgr.writev([b"central", b"directory"])
+                paths = mgr.volume_paths
+            outputs.append([p.read_bytes() for p in paths])
+
+        assert outputs[0] == outputs[1]
+        assert len(outputs[1]) == 5
+
+    def test_async_error_is_raised(self, temp_dir):
+        mgr = VolumeManager(temp_dir / "err.zip", MIN_VOLUME_SIZE, async_writes=True)
+        mgr.write(b"ok")
+        failing = mock.Mock()
+        failing.write.side_effect = OSError("disk full")
+        with mock.patch.object(mgr, "_current_file", failing):
+            mgr.write(b"lost")
+            with pytest.raises(OSError, match="disk full"):
+                mgr.write_at_offset(b"x", 0, 0)
+        with pytest.raises(OSError, match="disk full"):
+            mgr.close()
+        assert mgr._writer_thread is None
+
+
+class TestVolumeManagerPatches:
+    """Tests for write_at_offset."""
+
+    def test_deferred_patches_applied_on_close(self, temp_dir):
+        base = temp_dir / "patch.zip"
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"\x00" * (MIN_VOLUME_SIZE + 16))
+            mgr.write_at_offset(b"CD", 0, 2, defer=True)
+            mgr.write_at_offset(b"AB", 0, 0, defer=True)
+            mgr.write_at_offset(b"Z", 1, 15, defer=True)
+            mgr.start_final_volume()
+            # Nothing is written until close()
+            assert mgr.volume_paths[0].read_bytes()[:4] == b"\x00" * 4
+            paths = mgr.volume_paths
+
+        assert paths[0].read_bytes()[:5] == b"ABCD\x00"
+        assert paths[1].read_bytes()[-2:] == b"\x00Z"
+
+    def test_deferred_patch_follows_rename(self, temp_dir):
+        """Patches queued for .z01 land in the .zip it is renamed to."""
+        base = temp_dir / "renamed.zip"
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"\x00" * 8)
+            mgr.write_at_offset(b"PK", 0, 0, defer=True)
+            mgr.start_final_volume()
+            mgr.write(b"tail")
+
+        assert base.read_bytes() == b"PK" + b"\x00" * 6 + b"tail"
+
+    @pytest.mark.parametrize("defer", [False, True])
+    def test_patch_unknown_volume(self, temp_dir, defer):
+        with VolumeManager(temp_dir / "bad.zip", MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"x")
+            with pytest.raises(ValueError, match="has not been created"):
+                mgr.write_at_offset(b"x", 3, 0, defer=defer)
+
+    def test_immediate_patch_earlier_and_final_volume(self, temp_dir):
+        base = temp_dir / "immediate.zip"
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"\x00" * (MIN_VOLUME_SIZE + 4))
+            mgr.start_final_volume()
+            mgr.write(b"\x00\x00")
+            mgr.write_at_offset(b"A", 0, 1)
+            mgr.write_at_offset(b"B", 2, 1)
+            paths = mgr.volume_paths
+
+        assert paths[0].read_bytes()[:2] == b"\x00A"
+        assert base.read_bytes() == b"\x00B"
+
+
+class TestVolumeManagerWritev:
+    """Tests for scatter-gather writes."""
+
+    def test_writev_final_volume(self, temp_dir):
+        """Buffers land in order in the final volume, beyond IOV_MAX."""
+        base = temp_dir / "writev.zip"
+        buffers = [f"{i:05d}".encode() for i in range(3000)]
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.write(b"head")
+            mgr.start_final_volume()
+            mgr.writev(buffers)
+            assert mgr.total_bytes_written == 4 + 5 * 3000
+
+        assert base.read_bytes() == b"head" + b"".join(buffers)
+
+    def test_writev_split_volume_falls_back(self, temp_dir):
+        """Outside the final volume, writev still honours the split size."""
+        base = temp_dir / "writev_split.zip"
+        buffers = [b"x" * 1000] * 100
+
+        with VolumeManager(base, MIN_VOLUME_SIZE) as mgr:
+            mgr.writev(buffers)
+            paths = mgr.volume_paths
+
+        assert len(paths) == 2
+        assert paths[0].stat().st_size == MIN_VOLUME_SIZE
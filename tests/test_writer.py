@@ -1,9 +1,13 @@
 """Integration tests for SplitZipWriter."""
 
+import errno
 import io
 import os
+import shutil
+import struct
 import subprocess
-import tempfile
+import threading
+import tracemalloc
 import warnings
 import zipfile
 from pathlib import Path
@@ -16,17 +20,10 @@ from splitzip.exceptions import SplitZipError, UnsafePathError
 from splitzip.structures import Compression
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as td:
-        yield Path(td)
-
-
-@pytest.fixture
-def sample_files(temp_dir):
-    """Create sample files for testing."""
-    # Create some test files
+@pytest.fixture(scope="session")
+def _source_files(tmp_path_factory, random_blob):
+    """Create the sample files once; tests only read them."""
+    temp_dir = tmp_path_factory.mktemp("src")
     files = {}
 
     # Small text file
@@ -36,12 +33,12 @@ def sample_files(temp_dir):
 
     # Medium file (100KB)
     medium_file = temp_dir / "medium.bin"
-    medium_file.write_bytes(os.urandom(100 * 1024))
+    medium_file.write_bytes(random_blob[: 100 * 1024])
     files["medium"] = medium_file
 
     # Large file (1MB)
     large_file = temp_dir / "large.bin"
-    large_file.write_bytes(os.urandom(1024 * 1024))
+    large_file.write_bytes(random_blob[-1024 * 1024 :])
     files["large"] = large_file
 
     # Directory structure
@@ -57,6 +54,12 @@ def sample_files(temp_dir):
     return files
 
 
+@pytest.fixture
+def sample_files(_source_files):
+    """Paths to the shared sample files; write archives to temp_dir, not beside them."""
+    return dict(_source_files)
+
+
 class TestSplitZipWriter:
     """Tests for SplitZipWriter."""
 
@@ -83,18 +86,19 @@ class TestSplitZipWriter:
         archive_path = temp_dir / "output" / "multi.zip"
         archive_path.parent.mkdir()
 
-        # Use a small split size to force multiple volumes
-        with SplitZipWriter(archive_path, split_size="100KB") as zf:
-            zf.write(sample_files["large"])
+        # The smallest split size forces multiple volumes
+        with SplitZipWriter(archive_path, split_size="64KiB") as zf:
+            zf.write(sample_files["medium"])
 
         # Should create multiple volumes
         assert len(zf.volume_paths) > 1
         assert archive_path.exists()
 
-        # Check that .z01, .z02, etc. exist
-        for i, path in enumerate(zf.volume_paths[:-1]):
-            assert path.suffix == f".z{i+1:02d}"
-        assert zf.volume_paths[-1].suffix == ".zip"
+        # .z01, .z02, ... then the final .zip
+        count = len(zf.volume_paths)
+        assert [path.suffix for path in zf.volume_paths] == [
+            *(f".z{i:02d}" for i in range(1, count)), ".zip",
+        ]
 
     def test_writestr(self, temp_dir):
         """Test writing string content directly."""
@@ -108,13 +112,19 @@ class TestSplitZipWriter:
             assert zf_std.read("hello.txt") == b"Hello from bytes!"
             assert zf_std.read("world.txt") == b"Hello from string!"
 
-    def test_write_fileobj(self, temp_dir):
-        """Test writing from file-like object."""
+    @pytest.mark.parametrize("readinto", [True, False])
+    def test_write_fileobj(self, temp_dir, readinto):
+        """Test writing from file-like object, with and without readinto()."""
         archive_path = temp_dir / "fileobj.zip"
         data = b"Data from file object" * 1000
 
-        with SplitZipWriter(archive_path, split_size="1MB") as zf:
-            zf.write_fileobj(io.BytesIO(data), "fromobj.bin")
+        class ReadOnly:
+            def __init__(self, raw):
+                self.read = raw.read
+
+        fileobj = io.BytesIO(data) if readinto else ReadOnly(io.BytesIO(data))
+        with SplitZipWriter(archive_path, split_size="1MB", chunk_size=4096) as zf:
+            zf.write_fileobj(fileobj, "fromobj.bin")
 
         with zipfile.ZipFile(archive_path) as zf_std:
             assert zf_std.read("fromobj.bin") == data
@@ -134,6 +144,203 @@ class TestSplitZipWriter:
             assert "subdir/nested/" in names
             assert "subdir/nested/deep.txt" in names
 
+    def test_directory_order(self, temp_dir):
+        """Entries are depth-first in name order, each directory before its contents."""
+        src = temp_dir / "tree"
+        for rel in ("b/y.txt", "b/a/z.txt", "a.txt", "c.txt", "b0/x.txt"):
+            (src / rel).parent.mkdir(parents=True, exist_ok=True)
+            (src / rel).write_bytes(rel.encode())
+        archive_path = temp_dir / "order.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB") as zf:
+            zf.write(src)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.namelist() == [
+                "tree/", "tree/a.txt", "tree/b/", "tree/b/a/", "tree/b/a/z.txt",
+                "tree/b/y.txt", "tree/b0/", "tree/b0/x.txt", "tree/c.txt",
+            ]
+
+    def test_directory_file_metadata(self, temp_dir):
+        """Files found by the directory scan keep their mtime and permissions."""
+        subdir = temp_dir / "subdir"
+        subdir.mkdir()
+        path = subdir / "file1.txt"
+        path.write_text("File 1 content")
+        path.chmod(0o600)
+        os.utime(path, (0, 1_700_000_000))
+        archive_path = temp_dir / "metadata.zip"
+
+        with SplitZipWriter(archive_path, split_size="1MB") as zf:
+            zf.write(subdir)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            info = zf_std.getinfo("subdir/file1.txt")
+            assert info.external_attr >> 16 == 0o600
+            assert info.date_time == zipfile.ZipInfo.from_file(path).date_time
+
+    def test_data_descriptor_for_streamed_deflate(self, temp_dir, sample_files):
+        """Streamed DEFLATE entries end in a data descriptor; STORED ones are patched."""
+        archive_path = temp_dir / "descriptor.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB") as zf:
+            zf.write(sample_files["medium"])
+            zf.write(sample_files["small"], arcname="stored.txt", compression=Compression.STORED)
+            zf.writestr("small.txt", "not streamed")
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            infos = {info.filename: info for info in zf_std.infolist()}
+        assert {name: info.flag_bits & 0x08 for name, info in infos.items()} == {
+            "medium.bin": 0x08, "stored.txt": 0, "small.txt": 0,
+        }
+
+        info = infos["medium.bin"]
+        raw = archive_path.read_bytes()
+        assert raw[info.header_offset + 14 : info.header_offset + 26] == bytes(12)
+        end = info.header_offset + 30 + len("medium.bin") + info.compress_size
+        assert struct.unpack("<IIII", raw[end : end + 16]) == (
+            0x08074B50, info.CRC, info.compress_size, info.file_size,
+        )
+
+    @pytest.mark.parametrize("compression", [Compression.STORED, Compression.DEFLATED])
+    def test_small_file_single_write(self, temp_dir, sample_files, compression):
+        """Small files go out with a complete header, in one write and without a patch."""
+        archive_path = temp_dir / "small.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB", compression=compression) as zf:
+            mgr = zf._volume_mgr
+            with mock.patch.object(mgr, "write", wraps=mgr.write) as write:
+                zf.write(sample_files["small"])
+            assert write.call_count == 1
+            assert not mgr._pending_patches
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            info = zf_std.getinfo("small.txt")
+            assert zf_std.read(info) == b"Hello, World!"
+        raw = archive_path.read_bytes()
+        assert struct.unpack("<III", raw[14:26]) == (
+            info.CRC, info.compress_size, info.file_size,
+        )
+
+    def test_file_grown_since_stat(self, temp_dir, random_blob):
+        """A "small" file that is larger by the time it is read is streamed whole."""
+        src = temp_dir / "growing.bin"
+        data = random_blob[: 200 * 1024]
+        src.write_bytes(data)
+        st = src.stat()
+        stale = os.stat_result((st.st_mode, 0, 0, 0, 0, 0, 10, *st[7:10]))
+
+        archive_path = temp_dir / "grown.zip"
+        lstat = mock.patch("splitzip.writer.os.lstat", return_value=stale)
+
+        with SplitZipWriter(archive_path, split_size="10MB") as zf, lstat:
+            zf.write(src)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.read("growing.bin") == data
+            # Streamed (data descriptor), not buffered whole
+            assert zf_std.getinfo("growing.bin").flag_bits & 0x08
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+    def test_fifo_streamed(self, temp_dir, random_blob):
+        """A FIFO (size 0 to stat) is streamed rather than read whole into memory."""
+        fifo = temp_dir / "pipe"
+        os.mkfifo(fifo)
+        data = random_blob[: 200 * 1024]
+        feeder = threading.Thread(target=fifo.write_bytes, args=(data,), daemon=True)
+        feeder.start()
+
+        archive_path = temp_dir / "fifo.zip"
+        precompress = mock.patch("splitzip.writer._compress_file")
+
+        with SplitZipWriter(archive_path, split_size="10MB") as zf, precompress as compress_file:
+            zf.write(fifo)
+        feeder.join(timeout=10)
+        compress_file.assert_not_called()
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.read("pipe") == data
+
+    def test_large_writestr_not_joined(self, temp_dir, random_blob):
+        """Large in-memory payloads are written as given, not copied onto the header."""
+        data = random_blob[: 256 * 1024]
+
+        with SplitZipWriter(temp_dir / "big.zip", split_size="10MB") as zf:
+            mgr = zf._volume_mgr
+            with mock.patch.object(mgr, "write", wraps=mgr.write) as write:
+                zf.writestr("clip.mp4", data)
+            assert write.call_count == 2
+            assert write.call_args.args[0] is data
+
+        with zipfile.ZipFile(temp_dir / "big.zip") as zf_std:
+            assert zf_std.read("clip.mp4") == data
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_store_suffixes(self, temp_dir, workers):
+        """Already-compressed formats are stored unless compression is given."""
+        src = temp_dir / "media"
+        src.mkdir()
+        data = b"pretend this is compressed " * 100
+        for name in ("photo.JPG", "notes.txt", "archive.tar.gz"):
+            (src / name).write_bytes(data)
+        archive_path = temp_dir / "suffixes.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB", workers=workers) as zf:
+            zf.write(src)
+            zf.writestr("clip.mp4", data)
+            zf.writestr("forced.png", data, compression=Compression.DEFLATED)
+            zf.writestr("png/readme", data)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            methods = {info.filename: info.compress_type for info in zf_std.infolist()}
+            assert zf_std.read("media/photo.JPG") == data
+        assert methods == {
+            "media/": zipfile.ZIP_STORED,
+            "media/archive.tar.gz": zipfile.ZIP_STORED,
+            "media/notes.txt": zipfile.ZIP_DEFLATED,
+            "media/photo.JPG": zipfile.ZIP_STORED,
+            "clip.mp4": zipfile.ZIP_STORED,
+            "forced.png": zipfile.ZIP_DEFLATED,
+            "png/readme": zipfile.ZIP_DEFLATED,
+        }
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_incompressible_data_stored(self, temp_dir, random_blob, workers):
+        """Whole-buffer entries that DEFLATE would grow are stored instead."""
+        src = temp_dir / "noise"
+        src.mkdir()
+        noise = random_blob[:4096]
+        (src / "random.bin").write_bytes(noise)
+        (src / "empty.txt").write_bytes(b"")
+        (src / "text.txt").write_bytes(b"text " * 1000)
+        archive_path = temp_dir / "noise.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB", workers=workers) as zf:
+            zf.write(src)
+            zf.writestr("random2.bin", noise)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            methods = {info.filename: info.compress_type for info in zf_std.infolist()}
+            assert zf_std.read("noise/random.bin") == noise
+        assert methods == {
+            "noise/": zipfile.ZIP_STORED,
+            "noise/empty.txt": zipfile.ZIP_STORED,
+            "noise/random.bin": zipfile.ZIP_STORED,
+            "noise/text.txt": zipfile.ZIP_DEFLATED,
+            "random2.bin": zipfile.ZIP_STORED,
+        }
+
+    def test_store_suffixes_disabled(self, temp_dir):
+        archive_path = temp_dir / "nosuffixes.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB", store_suffixes=()) as zf:
+            zf.writestr("photo.jpg", b"x" * 1000)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.getinfo("photo.jpg").compress_type == zipfile.ZIP_DEFLATED
+
     def test_custom_arcname(self, temp_dir, sample_files):
         """Test custom archive names."""
         archive_path = temp_dir / "arcname.zip"
@@ -142,7 +349,9 @@ class TestSplitZipWriter:
             zf.write(sample_files["small"], arcname="renamed/file.txt")
 
         with zipfile.ZipFile(archive_path) as zf_std:
-            assert "renamed/file.txt" in zf_std.namelist()
+            assert zf_std.namelist() == ["renamed/file.txt"]
+            assert zf_std.read("renamed/file.txt") == b"Hello, World!"
+        assert zf.namelist() == ["renamed/file.txt"]
 
     def test_stored_compression(self, temp_dir, sample_files):
         """Test STORED (no compression) mode."""
@@ -163,9 +372,14 @@ class TestSplitZipWriter:
         def on_volume(num, path):
             volumes_created.append((num, path))
 
-        with SplitZipWriter(archive_path, split_size="100KB", on_volume=on_volume) as zf:
-            zf.write(sample_files["large"])
+        # STORED: only the volume count matters here, not compression
+        with SplitZipWriter(
+            archive_path, split_size="64KiB", compression=Compression.STORED,
+            on_volume=on_volume,
+        ) as zf:
+            zf.write(sample_files["medium"])
 
+        assert len(zf.volume_paths) > 1
         assert len(volumes_created) == len(zf.volume_paths)
 
     def test_progress_callback(self, temp_dir, sample_files):
@@ -184,6 +398,136 @@ class TestSplitZipWriter:
         last_call = progress_calls[-1]
         assert last_call[1] == last_call[2]
 
+    def test_in_memory_entries_share_timestamp(self, temp_dir):
+        """writestr/write_fileobj entries use the writer's creation time."""
+        archive_path = temp_dir / "timestamps.zip"
+
+        with SplitZipWriter(archive_path, split_size="1MB") as zf:
+            zf.writestr("a.txt", b"a")
+            zf.write_fileobj(io.BytesIO(b"b"), "b.txt")
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            infos = zf_std.infolist()
+            assert infos[0].date_time == infos[1].date_time
+
+    def test_small_volume_buffer(self, temp_dir, sample_files):
+        """A write buffer smaller than the data still produces a valid archive."""
+        archive_path = temp_dir / "smallbuf.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB", volume_buffer_size=4096) as zf:
+            zf.write(sample_files["medium"])
+            zf.writestr("hello.txt", b"Hello!")
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.read("medium.bin") == sample_files["medium"].read_bytes()
+            assert zf_std.read("hello.txt") == b"Hello!"
+
+    @pytest.mark.parametrize("compression", [Compression.STORED, Compression.DEFLATED])
+    def test_async_writes(self, temp_dir, sample_files, compression):
+        """Background volume writes produce the same archive as synchronous ones."""
+        outputs = []
+        for async_writes in (False, True):
+            archive_path = temp_dir / f"async_{async_writes}.zip"
+            with SplitZipWriter(
+                archive_path, split_size="10MB", compression=compression,
+                async_writes=async_writes,
+            ) as zf:
+                zf.write(sample_files["large"])
+                zf.write(sample_files["subdir"])
+            outputs.append(archive_path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+        with zipfile.ZipFile(temp_dir / "async_True.zip") as zf_std:
+            assert zf_std.read("large.bin") == sample_files["large"].read_bytes()
+
+    @pytest.mark.parametrize("compression", [Compression.STORED, Compression.DEFLATED])
+    def test_read_ahead(self, temp_dir, sample_files, compression):
+        """Files read on a background thread are archived intact."""
+        archive_path = temp_dir / "readahead.zip"
+
+        with SplitZipWriter(
+            archive_path, split_size="10MB", compression=compression,
+            read_ahead=True, chunk_size=64 * 1024,
+        ) as zf:
+            zf.write(sample_files["large"])
+            zf.write(sample_files["small"])
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            assert zf_std.read("large.bin") == sample_files["large"].read_bytes()
+
+    def test_read_ahead_stops_on_error(self, temp_dir, sample_files):
+        """An error while consuming chunks stops the reader thread."""
+        def fail(filename, done, total):
+            raise KeyboardInterrupt
+
+        threads_before = threading.active_count()
+        with pytest.raises(KeyboardInterrupt), SplitZipWriter(
+            temp_dir / "stop.zip", split_size="10MB", read_ahead=True,
+            chunk_size=64 * 1024, on_progress=fail,
+        ) as zf:
+            zf.write(sample_files["large"])
+        assert threading.active_count() == threads_before
+
+    @pytest.mark.parametrize("compression", [Compression.STORED, Compression.DEFLATED])
+    def test_memory_map(self, temp_dir, sample_files, compression):
+        archive_path = temp_dir / "mapped.zip"
+
+        with SplitZipWriter(
+            archive_path, split_size="10MB", compression=compression,
+            memory_map=True, chunk_size=64 * 1024,
+        ) as zf:
+            zf.write(sample_files["large"])
+            zf.write(sample_files["medium"])
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            assert zf_std.read("large.bin") == sample_files["large"].read_bytes()
+            assert zf_std.read("medium.bin") == sample_files["medium"].read_bytes()
+
+    @pytest.mark.parametrize("failure", ["callback", "write"])
+    def test_memory_map_error_mid_span(self, temp_dir, sample_files, failure):
+        """An error while a mapped chunk spans volumes is not masked by unmapping."""
+        def fail(data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        def on_volume(num, path):
+            if num == 1:
+                if failure == "callback":
+                    fail(b"")
+                zf._volume_mgr._emit = fail
+
+        zf = SplitZipWriter(
+            temp_dir / "mapped.zip", split_size="64KiB", compression=Compression.STORED,
+            memory_map=True, on_volume=on_volume,
+        )
+        with pytest.raises(OSError, match="No space left"), zf:
+            zf.write(sample_files["large"])
+
+    def test_chunk_size(self, temp_dir, sample_files):
+        """Files, buffers and streams are processed chunk_size bytes at a time."""
+        archive_path = temp_dir / "chunks.zip"
+        progress_calls = []
+        data = sample_files["medium"].read_bytes()
+
+        with SplitZipWriter(
+            archive_path, split_size="10MB", chunk_size=4096,
+            on_progress=lambda name, done, total: progress_calls.append(done),
+        ) as zf:
+            zf.write(sample_files["medium"])
+            zf.writestr("mem.bin", data)
+            zf.write_fileobj(io.BytesIO(data), "stream.bin", size=len(data))
+
+        assert progress_calls[:3] == [4096, 8192, 12288]
+        assert len(progress_calls) == 2 * 25
+        with zipfile.ZipFile(archive_path) as zf_std:
+            for name in ("medium.bin", "mem.bin", "stream.bin"):
+                assert zf_std.read(name) == data
+
+    def test_invalid_chunk_size(self, temp_dir):
+        with pytest.raises(ValueError, match="chunk_size"):
+            SplitZipWriter(temp_dir / "bad.zip", split_size="1MB", chunk_size=0)
+
 
 class TestCreateFunction:
     """Tests for the create() convenience function."""
@@ -202,17 +546,14 @@ class TestCreateFunction:
         assert Path(paths[-1]).exists()
 
         with zipfile.ZipFile(paths[-1]) as zf:
-            assert "small.txt" in zf.namelist()
-            assert "medium.bin" in zf.namelist()
+            assert zf.namelist() == ["small.txt", "medium.bin"]
 
 
 class TestCompatibility:
     """Tests for compatibility with standard tools."""
 
-    @pytest.mark.skipif(
-        subprocess.run(["which", "unzip"], capture_output=True).returncode != 0,
-        reason="unzip not available",
-    )
+    @pytest.mark.external
+    @pytest.mark.skipif(shutil.which("unzip") is None, reason="unzip not available")
     def test_unzip_compatibility(self, temp_dir, sample_files):
         """Test that archives can be extracted with standard unzip."""
         archive_path = temp_dir / "compat.zip"
@@ -227,19 +568,18 @@ class TestCompatibility:
         # Extract with unzip
         result = subprocess.run(
             ["unzip", "-o", str(archive_path), "-d", str(extract_dir)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
-        assert result.returncode == 0
+        assert result.returncode == 0, f"unzip failed: {result.stderr.decode()}"
         assert (extract_dir / "small.txt").exists()
         assert (extract_dir / "test.txt").exists()
         assert (extract_dir / "small.txt").read_text() == "Hello, World!"
         assert (extract_dir / "test.txt").read_text() == "Test content"
 
-    @pytest.mark.skipif(
-        subprocess.run(["which", "7z"], capture_output=True).returncode != 0,
-        reason="7z not available",
-    )
+    @pytest.mark.external
+    @pytest.mark.skipif(shutil.which("7z") is None, reason="7z not available")
     def test_7z_split_compatibility(self, temp_dir, sample_files):
         """Test that split archives can be extracted with 7-Zip."""
         archive_path = temp_dir / "split7z.zip"
@@ -256,7 +596,8 @@ class TestCompatibility:
         # Extract with 7z (use the .zip file, it will find the .z01, .z02, etc.)
         result = subprocess.run(
             ["7z", "x", str(archive_path), f"-o{extract_dir}", "-y"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
         assert result.returncode == 0, f"7z failed: {result.stderr.decode()}"
@@ -317,6 +658,18 @@ class TestEdgeCases:
             assert "日本語.txt" in names
             assert "émoji_🎉.txt" in names
 
+    def test_utf8_flag_only_for_non_ascii(self, temp_dir):
+        """The UTF-8 name flag (bit 11) is set only where the name needs it."""
+        archive_path = temp_dir / "flags.zip"
+
+        with SplitZipWriter(archive_path, split_size="1MB") as zf:
+            zf.writestr("plain.txt", "ASCII name")
+            zf.writestr("日本語.txt", "Japanese filename")
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.getinfo("plain.txt").flag_bits & 0x800 == 0
+            assert zf_std.getinfo("日本語.txt").flag_bits & 0x800
+
     def test_large_number_of_files(self, temp_dir):
         """Test archive with many files."""
         archive_path = temp_dir / "manyfiles.zip"
@@ -326,7 +679,8 @@ class TestEdgeCases:
                 zf.writestr(f"file_{i:03d}.txt", f"Content {i}")
 
         with zipfile.ZipFile(archive_path) as zf_std:
-            assert len(zf_std.namelist()) == 100
+            assert zf_std.namelist() == zf.namelist()
+        assert len(zf.namelist()) == 100
 
 
 class TestOverflowGuards:
@@ -351,9 +705,9 @@ class TestOverflowGuards:
         test_file.write_text("hello")
 
         with SplitZipWriter(archive_path, split_size="1MB") as zf:
-            # Patch stat to report huge file
-            fake_stat = os.stat_result((0o644, 0, 0, 0, 0, 0, 0x1_0000_0000, 0, 0, 0))
-            with mock.patch.object(Path, "stat", return_value=fake_stat):
+            # Patch lstat to report huge file
+            fake_stat = os.stat_result((0o100644, 0, 0, 0, 0, 0, 0x1_0000_0000, 0, 0, 0))
+            with mock.patch("splitzip.writer.os.lstat", return_value=fake_stat):
                 with pytest.raises(SplitZipError, match="4GB"):
                     zf.write(test_file)
 
@@ -448,6 +802,15 @@ class TestSymlinkHandling:
         with zipfile.ZipFile(archive_path) as zf_std:
             assert len(zf_std.namelist()) == 0
 
+    def test_dangling_symlink_not_found(self, temp_dir):
+        """A symlink whose target is missing is reported like a missing file."""
+        link = temp_dir / "dangling"
+        link.symlink_to(temp_dir / "missing.txt")
+        archive_path = temp_dir / "dangling.zip"
+
+        with pytest.raises(FileNotFoundError), SplitZipWriter(archive_path, split_size="1MB") as zf:
+            zf.write(link)
+
 
 class TestDirectorySanitization:
     """Tests for directory arcname sanitization."""
@@ -512,3 +875,143 @@ class TestExitOnError:
         # Should not be a valid ZIP (no central directory)
         with pytest.raises(Exception):
             zipfile.ZipFile(archive_path)
+
+
+class TestCompressionBackend:
+    """Tests for DEFLATE backend selection."""
+
+    @pytest.fixture(params=["zlib", "libdeflate"])
+    def backend(self, request):
+        """Run a test once per DEFLATE backend."""
+        if request.param == "libdeflate":
+            pytest.importorskip("deflate")
+            yield
+        else:
+            with mock.patch("splitzip.writer._libdeflate", None):
+                yield
+
+    def test_backend_roundtrip(self, temp_dir, sample_files, backend):
+        """Output from either backend is readable by standard tools."""
+        archive_path = temp_dir / "backend.zip"
+
+        with SplitZipWriter(archive_path, split_size="10MB") as zf:
+            zf.write(sample_files["medium"])
+            zf.writestr("text.txt", b"compress me " * 1000)
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.read("medium.bin") == sample_files["medium"].read_bytes()
+            assert zf_std.read("text.txt") == b"compress me " * 1000
+
+    @pytest.mark.parametrize("level", [0, -1, 10])
+    def test_invalid_compresslevel(self, temp_dir, sample_files, backend, level):
+        """Levels outside 1-9 are rejected up front, before anything is written."""
+        with pytest.raises(ValueError, match="compresslevel"):
+            SplitZipWriter(temp_dir / "init.zip", split_size="1MB", compresslevel=level)
+
+        with SplitZipWriter(temp_dir / "entry.zip", split_size="1MB") as zf:
+            with pytest.raises(ValueError, match="compresslevel"):
+                zf.writestr("a.txt", b"data", compresslevel=level)
+            with pytest.raises(ValueError, match="compresslevel"):
+                zf.write_fileobj(io.BytesIO(b"data"), "b.txt", compresslevel=level)
+            with pytest.raises(ValueError, match="compresslevel"):
+                zf.write(sample_files["small"], compresslevel=level)
+        assert zf.namelist() == []
+
+    @pytest.mark.parametrize("level", [1, 9])
+    def test_compresslevel_range(self, temp_dir, sample_files, backend, level):
+        """Every level in 1-9 works for small and large entries alike."""
+        archive_path = temp_dir / "levels.zip"
+        data = b"compress me " * 1000
+
+        with SplitZipWriter(archive_path, split_size="10MB", compresslevel=level) as zf:
+            zf.write(sample_files["large"])
+            zf.writestr("small.txt", data)
+            zf.write_fileobj(io.BytesIO(data), "stream.txt", size=len(data))
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            assert zf_std.read("small.txt") == zf_std.read("stream.txt") == data
+
+    def test_understated_stream_size(self, temp_dir, backend):
+        """A size hint smaller than the stream doesn't make it buffer whole."""
+        data = b"x" * (32 * 1024 * 1024)
+        archive_path = temp_dir / "understated.zip"
+
+        with SplitZipWriter(archive_path, split_size="100MB") as zf:
+            tracemalloc.start()
+            try:
+                zf.write_fileobj(io.BytesIO(data), "stream.bin", size=1)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        assert peak < 8 * 1024 * 1024
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.read("stream.bin") == data
+
+
+class TestParallelCompression:
+    """Tests for multi-threaded DEFLATE (workers > 1)."""
+
+    def test_parallel_roundtrip(self, temp_dir):
+        """Block-parallel output is a valid DEFLATE stream."""
+        data = b"".join(b"line %d of the parallel test\n" % i for i in range(60000))
+        src = temp_dir / "text.txt"
+        src.write_bytes(data)
+        archive_path = temp_dir / "parallel.zip"
+
+        with SplitZipWriter(archive_path, split_size="100MB", workers=4) as zf:
+            zf.write(src)
+            zf.writestr("mem.txt", data)
+            zf.write_fileobj(io.BytesIO(data), "stream.txt")
+
+        with zipfile.ZipFile(archive_path) as zf_std:
+            assert zf_std.testzip() is None
+            for name in ("text.txt", "mem.txt", "stream.txt"):
+                info = zf_std.getinfo(name)
+                assert info.compress_size < info.file_size
+                assert zf_std.read(name) == data
+
+    def test_output_independent_of_worker_count(self, temp_dir, random_blob):
+        # From a file, so every archive carries the same mtime
+        src = temp_dir / "data.bin"
+        src.write_bytes(random_blob[: 64 * 1024] * 8)
+        outputs = []
+        for workers in (2, 3, 8):
+            archive_path = temp_dir / f"w{workers}.zip"
+            with SplitZipWriter(archive_path, split_size="100MB", workers=workers) as zf:
+                zf.write(src)
+            outputs.append(archive_path.read_bytes())
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_directory_of_small_files(self, temp_dir):
+        """Files compressed ahead on the pool are written in directory order."""
+        src = temp_dir / "tree"
+        (src / "sub").mkdir(parents=True)
+        expected = {}
+        for i in range(20):
+            rel = f"sub/f{i:02d}.txt" if i % 3 else f"f{i:02d}.txt"
+            data = b"small file %d\n" % i * (i * 50)
+            (src / rel).write_bytes(data)
+            expected[f"tree/{rel}"] = data
+        big = b"".join(b"line %d\n" % i for i in range(200000))
+        (src / "big.txt").write_bytes(big)
+        expected["tree/big.txt"] = big
+
+        names = {}
+        for workers in (1, 4):
+            archive_path = temp_dir / f"tree{workers}.zip"
+            with SplitZipWriter(
+                archive_path, split_size="100MB", workers=workers, chunk_size=64 * 1024
+            ) as zf:
+                zf.write(src)
+            with zipfile.ZipFile(archive_path) as zf_std:
+                assert zf_std.testzip() is None
+                names[workers] = zf_std.namelist()
+                for name, data in expected.items():
+                    assert zf_std.read(name) == data
+        assert names[1] == names[4]
+
+    def test_invalid_workers(self, temp_dir):
+        with pytest.raises(ValueError, match="workers"):
+            SplitZipWriter(temp_dir / "bad.zip", split_size="1MB", workers=0)